@@ -15,6 +15,7 @@ import os
 import json
 import logging
 import mimetypes
+import uuid
 
 documents_bp = Blueprint('documents', __name__)
 
@@ -63,6 +64,12 @@ def _parse_sync_log_date(value: str, *, end_of_day: bool = False):
     if not raw:
         return None
 
+    # An unencoded '+' in the query string arrives as a space, e.g. a
+    # next_cursor started_at of "...T10:00:00.123456 00:00"; restore the sign
+    head, sep, tail = raw.rpartition(' ')
+    if sep and ':' in head and len(tail) == 5 and tail[2] == ':' and tail.replace(':', '').isdigit():
+        raw = f"{head}+{tail}"
+
     normalized = raw[:-1] + '+00:00' if raw.endswith('Z') else raw
 
     try:
@@ -271,12 +278,10 @@ def create_document(**kwargs):
     # If source_type is user and chat_id is provided, validate chat_id
     if source_type == 'user' and chat_id:
         try:
-            import uuid
             uuid.UUID(chat_id)  # Validate chat_id is a valid UUID
         except ValueError:
             return jsonify({'error': 'Invalid chat_id format. Must be a valid UUID'}), 400
 
-    import uuid
     original_filename = str(file.filename)
     file_ext = os.path.splitext(original_filename)[1].lower()
     stored_filename = f"{uuid.uuid4()}{file_ext}"
@@ -622,7 +627,6 @@ def update_document(doc_id, **kwargs):
         if not file.filename:
             return jsonify({'error': 'Invalid file name'}), 400
             
-        import uuid
         new_original_filename = str(file.filename)
         file_ext = os.path.splitext(new_original_filename)[1].lower()
         new_stored_filename = f"{uuid.uuid4()}{file_ext}"
@@ -940,6 +944,19 @@ def get_sync_logs(**kwargs):
     start_date = filters.get("start_date")
     end_date = filters.get("end_date")
 
+    # Keyset pagination cursor (next_cursor from the previous page)
+    cursor_started_at_raw = (request.args.get('cursor_started_at') or '').strip()
+    cursor_id = (request.args.get('cursor_id') or '').strip() or None
+    cursor_started_at = None
+    if cursor_started_at_raw or cursor_id:
+        cursor_started_at = _parse_sync_log_date(cursor_started_at_raw)
+        try:
+            cursor_id = str(uuid.UUID(cursor_id)) if cursor_id else None
+        except ValueError:
+            cursor_id = None
+        if not cursor_started_at or not cursor_id:
+            return jsonify({"message": "Cursor tidak valid. Gunakan cursor_started_at dan cursor_id dari next_cursor."}), 400
+
     try:
         from app.utils.sync_logger import SyncLogger
         logs, total = SyncLogger.get_sync_logs(
@@ -950,8 +967,17 @@ def get_sync_logs(**kwargs):
             search=search,
             start_date=start_date,
             end_date=end_date,
+            cursor_started_at=cursor_started_at,
+            cursor_id=cursor_id,
         )
 
+        next_cursor = None
+        if len(logs) == page_size:
+            next_cursor = {
+                "started_at": logs[-1].get("started_at"),
+                "id": logs[-1].get("id"),
+            }
+
         return jsonify({
             "message": "Berhasil mengambil log sinkronisasi dokumen",
             "data": logs,
@@ -959,7 +985,8 @@ def get_sync_logs(**kwargs):
                 "page": page,
                 "page_size": page_size,
                 "total": total,
-                "total_pages": (total // page_size) + (1 if total % page_size else 0)
+                "total_pages": (total // page_size) + (1 if total % page_size else 0),
+                "next_cursor": next_cursor
             }
         }), 200
 
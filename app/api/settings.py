@@ -10,7 +10,8 @@ from app.utils.time_provider import get_current_datetime
 
 from app.utils.text import to_snake_case, to_normal_text
 from app.utils.validation import valid_setting_datatype, valid_setting_value, is_openai_api_key
-from app.utils.setting import resolve_api_key_value, mask_api_key
+from app.utils.setting import resolve_api_key_value, mask_api_key, invalidate_setting
+from app.utils.pgvectorstore import invalidate_vectorstore_cache
 
 import logging
 import requests
@@ -345,6 +346,9 @@ def create_setting(**kwargs):
 
     try:
         results, _ = safe_db_query(insert_query, [name, type, description, data_type, unit, value, now, now])
+        invalidate_setting(name)
+        if name == 'api_key':
+            invalidate_vectorstore_cache()
 
         if not results:
             return jsonify({"error": "Gagal membuat setting"}), 500
@@ -432,6 +436,10 @@ def update_setting(setting_id, **kwargs):
     try:
         query_update = f"UPDATE settings SET {', '.join(update_fields)} WHERE id = %s"
         results, _ = safe_db_query(query_update, params)
+        invalidate_setting(setting_to_update[1])
+        invalidate_setting(name)
+        if 'api_key' in (setting_to_update[1], name):
+            invalidate_vectorstore_cache()
 
         if not results:
             return jsonify({"error": "Gagal mengupdate setting"}), 500
@@ -456,6 +464,8 @@ def delete_setting(setting_id, **kwargs):
 
         delete_query = "DELETE FROM settings WHERE id = %s AND is_protected = FALSE"
         safe_db_query(delete_query, [setting_id])
+        invalidate_setting()
+        invalidate_vectorstore_cache()
 
         return (
             jsonify({"message": "setting berhasil dihapus"}),
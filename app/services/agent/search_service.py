@@ -51,16 +51,19 @@ class SearchService:
     Handles various search strategies including web search, site-specific search, and LLM-based responses.
     """
 
-    def __init__(self, llm, prompt_service):
+    def __init__(self, llm, prompt_service, http_session: Optional[requests.Session] = None):
         """
         Initialize search service with LLM and prompt service dependencies.
         
         Args:
             llm: Language model instance
             prompt_service: Prompt service for template creation and formatting
+            http_session: Optional shared requests.Session for site fetches
         """
         self.llm = llm
         self.prompt_service = prompt_service
+        # Site fetch helpers go through this; a Session reuses connections
+        self._http = http_session or requests
 
         # Generic stopwords for dynamic phrase extraction (language-agnostic core + ID/EN)
         self._stopwords = {
@@ -329,7 +332,7 @@ class SearchService:
         base_api = "https://www.combiphar.com/back/api/v1/"
 
         try:
-            router_resp = requests.get(
+            router_resp = self._http.get(
                 base_api + "webrouter",
                 params={"uri": path},
                 headers=self._http_headers,
@@ -355,7 +358,7 @@ class SearchService:
             return None
 
         try:
-            page_resp = requests.get(
+            page_resp = self._http.get(
                 base_api + "pages/find",
                 params={"locale": locale, "pageCode": page_code},
                 headers=self._http_headers,
@@ -402,7 +405,7 @@ class SearchService:
         main_domains = {"www.combiphar.com", "combiphar.com"}
 
         try:
-            pages_resp = requests.get(
+            pages_resp = self._http.get(
                 "https://www.combiphar.com/back/api/v1/pages",
                 headers=self._http_headers,
                 timeout=10
@@ -521,7 +524,7 @@ class SearchService:
                 break
             sitemap_url = urljoin(base_root, suffix)
             try:
-                resp = requests.get(
+                resp = self._http.get(
                     sitemap_url,
                     headers=self._http_headers,
                     timeout=10
@@ -555,7 +558,7 @@ class SearchService:
     def _fetch_generic_site_content(self, url: str) -> Optional[str]:
         """Fetch and sanitize HTML content from arbitrary Combiphar-affiliated sites."""
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 url,
                 headers=self._http_headers,
                 timeout=10
@@ -63,6 +63,7 @@ _register(
     'document',
     (
         'validate_file_content',
+        'validate_file_path',
         'extract_text_from_pdf',
         'extract_text_from_image_ocr',
         'extract_text_from_document',
@@ -70,7 +71,7 @@ _register(
     ),
 )
 
-_register('pgvectorstore', ('get_vectorstore',))
+_register('pgvectorstore', ('get_vectorstore', 'invalidate_vectorstore_cache'))
 
 _register('portal_pull', ('pull_from_portal_logic',))
 
@@ -78,9 +78,12 @@ def with_db_connection(func):
     return wrapper
 
 
-def safe_db_query(query, params=None, many=False):
+def safe_db_query(query, params=None, many=False, page_size=100):
     """
     Execute database query dengan error handling
+
+    With many=True, page_size is the number of rows execute_values packs
+    into each INSERT statement (psycopg2's default is 100).
     """
     conn = None
     cursor = None
@@ -89,7 +92,7 @@ def safe_db_query(query, params=None, many=False):
         cursor = conn.cursor()
 
         if many: 
-            execute_values(cursor, query, params)
+            execute_values(cursor, query, params, page_size=page_size)
         else:
             if params:
                 cursor.execute(query, params)
@@ -426,6 +426,65 @@ def validate_file_content(content, filename, max_size_mb=50):
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
+_HTML_ERROR_INDICATORS = (b'<!doctype html', b'<html>', b'not found', b'404 error', b'error page')
+
+
+def _file_contains_html_error(f, first_block, block_size=1024 * 1024):
+    """Scan an open file for HTML error markers block by block (case-insensitive)."""
+    overlap = max(len(marker) for marker in _HTML_ERROR_INDICATORS) - 1
+    tail = b''
+    block = first_block
+    while block:
+        window = tail + block.lower()
+        if any(marker in window for marker in _HTML_ERROR_INDICATORS):
+            return True
+        tail = window[-overlap:]
+        block = f.read(block_size)
+    return False
+
+
+def validate_file_path(file_path, filename, max_size_mb=50, size=None, header_bytes=4096):
+    """
+    Validate a file already saved on disk by sniffing its header.
+    Same checks as validate_file_content without loading the whole file:
+    the PDF HTML-error check still scans the whole body, one block at a time.
+    Returns (is_valid, reason) tuple.
+    """
+    try:
+        if size is None:
+            size = os.path.getsize(file_path)
+
+        size_mb = size / (1024 * 1024)
+        if size_mb > max_size_mb:
+            return False, f"File too large: {size_mb:.1f}MB (max: {max_size_mb}MB)"
+
+        if size < 50:
+            return False, "File too small (less than 50 bytes)"
+
+        with open(file_path, 'rb') as f:
+            header = f.read(header_bytes)
+
+            if filename.lower().endswith('.pdf'):
+                if not header.startswith(b'%PDF-'):
+                    return False, "Invalid PDF file (missing PDF header)"
+
+                if _file_contains_html_error(f, header):
+                    return False, "File appears to be an HTML error page, not a valid PDF"
+
+            elif filename.lower().endswith(('.txt', '.doc', '.docx')):
+                try:
+                    header.decode('utf-8')
+                except UnicodeDecodeError:
+                    try:
+                        header.decode('latin-1')
+                    except UnicodeDecodeError:
+                        return False, "Cannot decode text file with UTF-8 or Latin-1 encoding"
+
+        return True, "Valid file"
+
+    except Exception as e:
+        return False, f"Validation error: {str(e)}"
+
 def extract_text_from_pdf(path, document_source=None):
     """Extract text from PDF using pdfplumber."""
     if not pdfplumber:
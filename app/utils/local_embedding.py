@@ -251,6 +251,7 @@ def _process_single_file(
         docs = []
         display_name = file_path.name
         prefix = f"{display_name}\n\n" if display_name else ""
+        chunk_total = sum(1 for c in chunks if c.strip())
         for i, chunk in enumerate(chunks):
             if chunk.strip():
                 metadata = {
@@ -263,7 +264,7 @@ def _process_single_file(
                     "storage_path": storage_path,
                     "mime_type": mime_type,
                     "chunk_index": i,
-                    "chunk_total": len([c for c in chunks if c.strip()]),
+                    "chunk_total": chunk_total,
                     "created_at": created_time.isoformat()
                 }
                 content = f"{prefix}{chunk}" if prefix else chunk
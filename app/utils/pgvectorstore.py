@@ -4,17 +4,23 @@ Native PostgreSQL vector operations for document similarity search.
 """
 import os
 import logging
+import threading
 import numpy as np
 from typing import List, Dict, Tuple, Any, Optional, Union
 import uuid
 from langchain_core.documents import Document
 from app.utils.database import safe_db_query, getConnection
 from app.utils.embedding import get_openai_embeddings, get_embedding_dimensions
+from app.utils.setting import get_openai_api_key
 from psycopg2.extras import Json
 from pgvector.psycopg2 import register_vector
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT in add_texts; each row carries a full embedding,
+# so large batches are split to keep statements a manageable size
+_VECTOR_INSERT_PAGE_SIZE = 500
+
 class PGVectorStore:
     """
     PostgreSQL vector store implementation using pgvector extension.
@@ -119,8 +125,15 @@ class PGVectorStore:
                     updated_at = CURRENT_TIMESTAMP
             """
             
-            rowcount, _ = safe_db_query(query, insert_data, many=True)
-            logger.info(f"✅ Added {rowcount} text embeddings to vector store")
+            # Multi-row INSERTs of up to _VECTOR_INSERT_PAGE_SIZE rows instead of 100-row pages
+            # (rowcount only covers the last page, so the batch size is logged)
+            safe_db_query(
+                query,
+                insert_data,
+                many=True,
+                page_size=min(len(insert_data), _VECTOR_INSERT_PAGE_SIZE),
+            )
+            logger.info(f"✅ Added {len(insert_data)} text embeddings to vector store")
             
             return ids[:len(insert_data)]
             
@@ -780,23 +793,52 @@ class PGVectorRetriever:
         return self.get_relevant_documents(query)
 
 
+# Shared vectorstore handle, reused while the resolved API key is unchanged
+_vectorstore_instance: Optional[PGVectorStore] = None
+_vectorstore_api_key: Optional[str] = None
+_vectorstore_lock = threading.Lock()
+
+
+def invalidate_vectorstore_cache() -> None:
+    """
+    Drop the cached vectorstore so the next get_vectorstore() call rebuilds it.
+    Call this when the embedding API key or DB configuration changes.
+    """
+    global _vectorstore_instance, _vectorstore_api_key
+    with _vectorstore_lock:
+        _vectorstore_instance = None
+        _vectorstore_api_key = None
+
+
 def get_vectorstore() -> Optional[PGVectorStore]:
     """
     Get vectorstore instance using PGVector with PostgreSQL.
     Returns configured PGVector vectorstore or None if unavailable.
+    The instance is cached per process and keyed on the API key resolved
+    through the settings cache, so a key changed in any worker is picked up
+    within SETTINGS_CACHE_TTL. Failures are not cached.
     """
+    global _vectorstore_instance, _vectorstore_api_key
     try:
-        # Initialize OpenAI embeddings
-        embeddings = get_openai_embeddings()
-
-        # Create PGVector store
-        vectorstore = PGVectorStore(
-            collection_name="combiphar_docs",
-            embedding_function=embeddings
-        )
+        api_key = get_openai_api_key()
+        instance = _vectorstore_instance
+        if instance is not None and _vectorstore_api_key == api_key:
+            return instance
+
+        with _vectorstore_lock:
+            if _vectorstore_instance is None or _vectorstore_api_key != api_key:
+                # Initialize OpenAI embeddings
+                embeddings = get_openai_embeddings(api_key=api_key)
+
+                # Create PGVector store
+                _vectorstore_instance = PGVectorStore(
+                    collection_name="combiphar_docs",
+                    embedding_function=embeddings
+                )
+                _vectorstore_api_key = api_key
 
-        logger.info("✅ PGVector store initialized successfully")
-        return vectorstore
+                logger.info("✅ PGVector store initialized successfully")
+            return _vectorstore_instance
 
     except Exception as e:
         logger.error(f"❌ Failed to initialize PGVector store: {e}")
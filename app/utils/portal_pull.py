@@ -4,10 +4,14 @@ Portal pull utilities for fetching and processing documents from Combiphar porta
 import os
 import requests
 import logging
-import json
+import mimetypes
 import uuid
 
+import orjson
 from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
@@ -15,7 +19,7 @@ from .database import safe_db_query
 from .portal import create_user_token
 from .pgvectorstore import get_vectorstore
 from .document import (
-    validate_file_content,
+    validate_file_path,
     extract_text_from_document,
     validate_document_exist_db,
 )
@@ -24,6 +28,19 @@ from .time_provider import get_current_datetime
 DEFAULT_DOWNLOAD_TIMEOUT = 60
 PORTAL_DOWNLOAD_MAX_RETRIES = 3
 
+# Shared HTTP session so portal requests reuse keep-alive connections instead of
+# paying a new TCP + TLS handshake per document. Retries stay in _download_with_retry.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=0))
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Characters replaced with '_' when normalizing portal filenames
+_FNAME_TRANS = str.maketrans({' ': '_', '/': '_', '\\': '_'})
+
+# Shared splitter; building it once avoids re-creating its separator state per sync
+_TEXT_SPLITTER = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=200)
+
 def _get_portal_download_timeout():
     """Fetch configurable document download timeout with safe fallback."""
     env_value = os.getenv("PORTAL_DOWNLOAD_TIMEOUT")
@@ -51,37 +68,113 @@ def _get_portal_download_timeout():
     return timeout_value
 
 
-def _download_with_retry(url, timeout, max_retries=PORTAL_DOWNLOAD_MAX_RETRIES):
-    """Download helper that retries on timeout up to max_retries times."""
+def _download_with_retry(url, file_path, timeout, max_retries=PORTAL_DOWNLOAD_MAX_RETRIES):
+    """
+    Stream url into file_path, retrying on timeout up to max_retries times.
+
+    With stream=True a stall while reading the body surfaces from iter_content
+    as ConnectionError(ReadTimeoutError) rather than Timeout; it is retried the
+    same way and re-raised as ReadTimeout once retries run out.
+    Returns the number of bytes written.
+    """
     for attempt in range(1, max_retries + 1):
         try:
-            return requests.get(url, timeout=timeout)
+            response = _session.get(url, timeout=timeout, stream=True)
+            # Close the pooled connection on every path, including HTTP errors
+            with response:
+                response.raise_for_status()
+                return _stream_to_file(response, file_path)
         except requests.exceptions.Timeout as exc:
-            logging.warning(
-                "Timeout downloading %s (attempt %s/%s): %s",
-                url,
-                attempt,
-                max_retries,
-                exc,
-            )
-            if attempt == max_retries:
+            error = exc
+        except requests.exceptions.ConnectionError as exc:
+            if not (exc.args and isinstance(exc.args[0], ReadTimeoutError)):
                 raise
+            error = exc
+
+        logging.warning(
+            "Timeout downloading %s (attempt %s/%s): %s",
+            url,
+            attempt,
+            max_retries,
+            error,
+        )
+        if attempt == max_retries:
+            if isinstance(error, requests.exceptions.Timeout):
+                raise error
+            raise requests.exceptions.ReadTimeout(str(error)) from error
+
+def _stream_to_file(response, file_path, chunk_size=65536):
+    """Write a streaming response to disk chunk by chunk and return the byte count."""
+    content_len = 0
+    try:
+        with open(file_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    content_len += len(chunk)
+    except Exception:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+    finally:
+        response.close()
+    return content_len
+
+def _move_to_stored_filename(file_path, new_file_path):
+    """
+    Atomically move a downloaded file to its UUID-based stored filename.
+    Returns True on success, False if the rename failed.
+    """
+    if file_path == new_file_path:
+        return True
+    try:
+        os.replace(file_path, new_file_path)
+        logging.info(f"Renamed {os.path.basename(file_path)} to {os.path.basename(new_file_path)}")
+        return True
+    except OSError as e:
+        logging.error(f"❌ Failed to rename {file_path} to {new_file_path}: {e}")
+        return False
+
+def _promote_stored_file(document_db_id, file_path, new_file_path):
+    """
+    Move a processed download to its stored filename and point the documents
+    row at it. Returns True on success; on failure the file is left at (or
+    moved back to) file_path, which the row still references.
+    """
+    if not _move_to_stored_filename(file_path, new_file_path):
+        return False
+    try:
+        safe_db_query(
+            "UPDATE documents SET storage_path = %s WHERE id = %s",
+            (os.path.relpath(new_file_path, '.'), document_db_id)
+        )
+        return True
+    except Exception as e:
+        logging.error(f"❌ Failed to update storage_path for document {document_db_id}: {e}")
+        _move_to_stored_filename(new_file_path, file_path)
+        return False
 
 def pull_from_portal_logic(sync_logger=None):
     """Core logic to pull documents from portal, perform OCR, and store embeddings."""
+    try:
+        return _pull_from_portal(sync_logger)
+    finally:
+        # Write buffered sync_log_details on every exit path, including early
+        # returns and exceptions
+        if sync_logger:
+            sync_logger.flush()
+
+def _pull_from_portal(sync_logger):
     logging.info("Starting pull_from_portal_logic")
 
     # Generate token and fetch list
     token = create_user_token()
     url = f"https://portal.combiphar.com/Documents/GetDocumentList?q={token}"
     try:
-        response = requests.get(url, timeout=10)
+        response = _session.get(url, timeout=10)
         response.raise_for_status()
-        # attempt JSON parsing regardless of content-type
-        try:
-            data = response.json()
-        except Exception:
-            data = json.loads(response.text)
+        # parse raw bytes regardless of content-type
+        data = orjson.loads(response.content)
     except Exception as e:
         error_msg = f"Failed to fetch document list: {e}"
         logging.error(error_msg)
@@ -113,6 +206,8 @@ def pull_from_portal_logic(sync_logger=None):
     # Setup folders and get vector store
     download_folder = './data/documents/portal/'
     os.makedirs(download_folder, exist_ok=True)
+    # One directory scan instead of a stat() per existing document
+    existing_files = {entry.name for entry in os.scandir(download_folder) if entry.is_file()}
 
     # Get vectorstore 
     vectorstore = get_vectorstore()
@@ -120,11 +215,66 @@ def pull_from_portal_logic(sync_logger=None):
         logging.error("❌ Cannot connect to vector store. Aborting pull from portal.")
         return {"downloaded_files": []}
 
-    # Initialize text splitter for chunking
-    text_splitter = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=200)
     downloaded = []
     download_timeout = _get_portal_download_timeout()
-    for item in file_list:
+
+    # Drop unpublished items up-front so the main loop only sees work to do
+    published = [i for i in file_list if isinstance(i, dict) and i.get('IsPublished')]
+    unpublished = [i for i in file_list if isinstance(i, dict) and not i.get('IsPublished')]
+    if unpublished:
+        logging.info(f"Skipping {len(unpublished)} unpublished documents")
+        if sync_logger:
+            for i in unpublished:
+                unpublished_id = i.get('Id') or i.get('ID')
+                sync_logger.log_document_result(
+                    document_title=i.get('Title'),
+                    document_filename=i.get('FileName'),
+                    document_id=str(unpublished_id) if unpublished_id else None,
+                    status='failed',
+                    error_message='Document not published',
+                    metadata={'is_published': i.get('IsPublished', False)}
+                )
+
+    # Prefetch existing portal documents and their vector counts in two queries
+    # instead of issuing two lookups per item inside the loop.
+    filenames = [i.get('FileName') for i in published if i.get('FileName')]
+    existing_by_filename = {}
+    vec_counts = {}
+    if filenames:
+        try:
+            existing_rows, _ = safe_db_query('''
+                SELECT original_filename, stored_filename, id, storage_path,
+                       metadata->>'FileName' AS fn
+                FROM documents
+                WHERE source_type = 'portal' AND metadata->>'FileName' = ANY(%s)
+            ''', (filenames,))
+            if isinstance(existing_rows, list):
+                for row in existing_rows:
+                    existing_by_filename.setdefault(row[4], tuple(row[:4]))
+        except Exception as prefetch_err:
+            logging.warning(f"Failed to prefetch existing portal documents: {prefetch_err}")
+
+    existing_ids = [str(row[2]) for row in existing_by_filename.values() if row[2]]
+    if existing_ids:
+        try:
+            count_rows, _ = safe_db_query('''
+                SELECT document_id, COUNT(*)
+                FROM documents_vectors
+                WHERE document_id = ANY(%s::uuid[])
+                GROUP BY document_id
+            ''', (existing_ids,))
+            if isinstance(count_rows, list):
+                vec_counts = {str(row[0]): row[1] or 0 for row in count_rows}
+        except Exception as vector_err:
+            logging.warning(f"Failed to prefetch embedding counts for portal documents: {vector_err}")
+
+    # Bind hot callables to locals so the per-item loop skips global/attribute lookups
+    _safe_db_query = safe_db_query
+    _validate = validate_document_exist_db
+    _log = sync_logger.log_document_result if sync_logger else None
+    _split_text = _TEXT_SPLITTER.split_text
+
+    for item in published:
         logging.debug(f"Processing item: {item}")
         now = get_current_datetime()
         document_name = item.get('Title')
@@ -133,22 +283,6 @@ def pull_from_portal_logic(sync_logger=None):
         name, ext = os.path.splitext(orig_filename)
         normalized = name + (ext.lower() if ext else '')
         document_source = normalized
-        is_published = item.get('IsPublished', False)
-
-        # Skip if not published
-        if not is_published:
-            logging.info(f"Skipping unpublished document: {item.get('Title')}")
-            # Log as skipped (not failed)
-            if sync_logger:
-                sync_logger.log_document_result(
-                    document_title=document_name,
-                    document_filename=orig_filename,
-                    document_id=str(document_id) if document_id else None,
-                    status='failed',
-                    error_message='Document not published',
-                    metadata={'is_published': is_published}
-                )
-            continue
 
         # Extract metadata
         logging.info(f"Processing document: {document_name} (source: {document_source})")
@@ -158,17 +292,12 @@ def pull_from_portal_logic(sync_logger=None):
             document_source = f"{uuid.uuid4()}{ext.lower() if ext else ''}"
             logging.warning(f"Generated new document_source: {document_source} for {orig_filename}")
         
-        document_source = document_source.strip().replace(' ', '_').replace('/', '_').replace('\\', '_')
+        document_source = document_source.strip().translate(_FNAME_TRANS)
         if not document_source.endswith(ext.lower() if ext else ''):
             document_source += (ext.lower() if ext else '')
         
         # Check if document exists and compare filenames for changes
-        existing_doc_query = '''
-            SELECT original_filename, stored_filename, id, storage_path 
-            FROM documents 
-            WHERE source_type = 'portal' AND metadata::json->>'FileName' = %s
-        '''
-        existing_results, _ = safe_db_query(existing_doc_query, (orig_filename,))
+        existing_row = existing_by_filename.get(orig_filename)
         
         should_skip = False
         needs_reprocessing = False
@@ -176,41 +305,25 @@ def pull_from_portal_logic(sync_logger=None):
         existing_doc_id = None
         existing_storage_path = None
         
-        if existing_results:
-            db_original_filename = existing_results[0][0]
-            existing_stored_filename = existing_results[0][1]
-            existing_doc_id = existing_results[0][2]
-            existing_storage_path = existing_results[0][3] if len(existing_results[0]) > 3 else None
+        if existing_row:
+            db_original_filename, existing_stored_filename, existing_doc_id, existing_storage_path = existing_row
             
             # Additional validation using validate_document_exist_db
-            if existing_stored_filename and not validate_document_exist_db(existing_stored_filename):
+            if existing_stored_filename and not _validate(existing_stored_filename):
                 logging.warning(f"Database inconsistency detected for {existing_stored_filename}, will reprocess")
                 needs_reprocessing = True
             else:
-                candidate_paths = []
-                if existing_storage_path:
-                    if os.path.isabs(existing_storage_path):
-                        candidate_paths.append(existing_storage_path)
-                    else:
-                        candidate_paths.append(os.path.join('.', existing_storage_path))
-                if existing_stored_filename:
-                    candidate_paths.append(os.path.join(download_folder, existing_stored_filename))
-
-                file_exists = any(os.path.isfile(path) for path in candidate_paths)
-
-                vectors_exist = False
-                if existing_doc_id:
-                    try:
-                        vector_count_rows, _ = safe_db_query(
-                            "SELECT COUNT(*) FROM documents_vectors WHERE document_id = %s",
-                            (existing_doc_id,),
-                        )
-                        if isinstance(vector_count_rows, list) and vector_count_rows:
-                            vectors_exist = (vector_count_rows[0][0] or 0) > 0
-                    except Exception as vector_err:
-                        logging.warning(
-                            f"Failed to verify embeddings for document {existing_doc_id}: {vector_err}"
-                        )
+                # Check the download folder listing first; only stat storage_path
+                # when it may point outside download_folder.
+                file_exists = bool(existing_stored_filename) and existing_stored_filename in existing_files
+                if not file_exists and existing_storage_path:
+                    file_exists = os.path.isfile(
+                        existing_storage_path
+                        if os.path.isabs(existing_storage_path)
+                        else os.path.join('.', existing_storage_path)
+                    )
+
+                vectors_exist = bool(existing_doc_id) and vec_counts.get(str(existing_doc_id), 0) > 0
 
                 if not file_exists:
                     logging.warning(
@@ -241,22 +354,21 @@ def pull_from_portal_logic(sync_logger=None):
         # If needs reprocessing, delete old vector data first
         if needs_reprocessing and existing_stored_filename:
             try:
-                # Delete from vector store using the stored filename as document source
-                vectorstore = get_vectorstore()
-                if vectorstore:
-                    # Delete documents with matching stored_filename from PGVector
-                    vectorstore.delete_by_metadata({"stored_filename": existing_stored_filename})
-                    logging.info(f"✅ Deleted old vector data for {existing_stored_filename}")
+                # Delete documents with matching stored_filename from PGVector
+                vectorstore.delete_by_metadata({"stored_filename": existing_stored_filename})
+                logging.info(f"✅ Deleted old vector data for {existing_stored_filename}")
                 
                 # Delete old database record
                 delete_query = "DELETE FROM documents WHERE id = %s"
-                safe_db_query(delete_query, (existing_doc_id,))
+                _safe_db_query(delete_query, (existing_doc_id,))
+                existing_by_filename.pop(orig_filename, None)
                 logging.info(f"✅ Deleted old database record for {existing_stored_filename}")
                 
                 # Delete old file if it exists
                 old_file_path = os.path.join(download_folder, existing_stored_filename)
-                if os.path.exists(old_file_path):
+                if existing_stored_filename in existing_files:
                     os.remove(old_file_path)
+                    existing_files.discard(existing_stored_filename)
                     logging.info(f"✅ Deleted old file {old_file_path}")
                 elif existing_storage_path:
                     candidate_path = (
@@ -278,9 +390,9 @@ def pull_from_portal_logic(sync_logger=None):
             base_dl = "https://portal.combiphar.com/DocAnnouncements"
             file_url = f"{base_dl}/{orig_filename}"
         logging.info(f"Downloading file from {file_url}")
+        file_path = os.path.join(download_folder, document_source)
         try:
-            resp_file = _download_with_retry(file_url, download_timeout)
-            resp_file.raise_for_status()
+            content_len = _download_with_retry(file_url, file_path, download_timeout)
         except requests.exceptions.Timeout as e:
             error_msg = f"Failed to download after {PORTAL_DOWNLOAD_MAX_RETRIES} timeout retries: {e}"
             logging.warning(
@@ -290,8 +402,8 @@ def pull_from_portal_logic(sync_logger=None):
                 e,
             )
             # Log download timeout failure
-            if sync_logger:
-                sync_logger.log_document_result(
+            if _log:
+                _log(
                     document_title=document_name,
                     document_filename=orig_filename,
                     document_id=str(document_id) if document_id else None,
@@ -304,8 +416,8 @@ def pull_from_portal_logic(sync_logger=None):
             error_msg = f"Failed to download: {e}"
             logging.warning(f"Failed to download {file_url}: {e}")
             # Log download failure
-            if sync_logger:
-                sync_logger.log_document_result(
+            if _log:
+                _log(
                     document_title=document_name,
                     document_filename=orig_filename,
                     document_id=str(document_id) if document_id else None,
@@ -315,13 +427,17 @@ def pull_from_portal_logic(sync_logger=None):
                 )
             continue
 
-        # Validate file content before saving and processing
-        is_valid, validation_reason = validate_file_content(resp_file.content, document_source)
+        # Validate the saved file before processing
+        is_valid, validation_reason = validate_file_path(file_path, document_source, size=content_len)
         if not is_valid:
             logging.warning(f"⚠️ Skipping invalid file {document_source}: {validation_reason}")
+            try:
+                os.remove(file_path)
+            except OSError as del_e:
+                logging.warning(f"Failed to remove invalid file {file_path}: {del_e}")
             # Log validation failure
-            if sync_logger:
-                sync_logger.log_document_result(
+            if _log:
+                _log(
                     document_title=document_name,
                     document_filename=orig_filename,
                     document_id=str(document_id) if document_id else None,
@@ -331,9 +447,6 @@ def pull_from_portal_logic(sync_logger=None):
                 )
             continue
 
-        file_path = os.path.join(download_folder, document_source)
-        with open(file_path, 'wb') as f:
-            f.write(resp_file.content)
         downloaded.append(document_source)
         logging.info(f"✅ File {document_source} validated and saved successfully")
 
@@ -342,13 +455,9 @@ def pull_from_portal_logic(sync_logger=None):
 
         if not text.strip():
             logging.warning(f"⚠️ No text extracted from {document_source}, skipping vector storage")
-            file_size = 0
-            try:
-                file_size = os.path.getsize(file_path)
-            except Exception as size_err:
-                logging.warning(f"Failed to get file size for {file_path}: {size_err}")
-            if sync_logger:
-                sync_logger.log_document_result(
+            file_size = content_len
+            if _log:
+                _log(
                     document_title=document_name,
                     document_filename=orig_filename,
                     document_id=str(document_id) if document_id else None,
@@ -359,40 +468,25 @@ def pull_from_portal_logic(sync_logger=None):
                 )
             continue
         # Save metadata to database using new structure
-        import uuid as uuid_lib
-        import mimetypes
-        
-        # Generate UUID-based stored filename
+        # Generate UUID-based stored filename; documents.stored_filename is UNIQUE,
+        # so a (practically impossible) collision surfaces as a failed insert.
         file_ext = os.path.splitext(document_source)[1].lower()
-        stored_filename = f"{uuid_lib.uuid4()}{file_ext}"
-        
-        # Ensure generated stored_filename doesn't already exist (extremely unlikely but good practice)
-        while validate_document_exist_db(stored_filename):
-            logging.warning(f"UUID collision detected for {stored_filename}, generating new UUID")
-            stored_filename = f"{uuid_lib.uuid4()}{file_ext}"
+        stored_filename = f"{uuid.uuid4()}{file_ext}"
         
-        try:
-            file_size = os.path.getsize(file_path)
-        except Exception as size_err:
-            logging.warning(f"Failed to get file size for {file_path}: {size_err}")
-            file_size = 0
+        # Byte count was tracked while streaming the download, no stat needed
+        file_size = content_len
         mime_type, _ = mimetypes.guess_type(document_source)
         if not mime_type:
             mime_type = 'application/octet-stream'
         
-        # Prepare storage path (will be updated after file rename)
-        storage_path = os.path.relpath(file_path, '.')
-        
         # Prepare metadata
-        item_metadata = json.dumps(item)
+        item_metadata = orjson.dumps(item).decode()
         
-        # Rename the actual file to use stored_filename
+        # The row is written with the download's own path; the file is moved to
+        # its stored_filename (and storage_path updated) only once embedding
+        # succeeds, so a failed embedding leaves just the download to remove.
         new_file_path = os.path.join(download_folder, stored_filename)
-        if file_path != new_file_path:
-            os.rename(file_path, new_file_path)
-            logging.info(f"Renamed {document_source} to {stored_filename}")
-            # Update storage path to reflect new filename
-            storage_path = os.path.relpath(new_file_path, '.')
+        storage_path = os.path.relpath(new_file_path, '.')
         
         insert_query = '''
             INSERT INTO documents
@@ -400,47 +494,43 @@ def pull_from_portal_logic(sync_logger=None):
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             RETURNING id
         '''
-        result, _ = safe_db_query(insert_query, (
+        result, _ = _safe_db_query(insert_query, (
             'portal',  # source_type
             document_source,  # original_filename 
             stored_filename,  # stored_filename
             mime_type,  # mime_type
             file_size,  # size_bytes
             item_metadata,  # metadata
-            storage_path,  # storage_path
+            os.path.relpath(file_path, '.'),  # storage_path until the file is moved
             None  # uploaded_by (system upload)
         ))
         
-        # Get the document ID from the database insert
-        # Handle both cases: result as list (SELECT-like) or as int (INSERT rowcount)
+        # safe_db_query returns RETURNING rows whenever the cursor has a description
         if isinstance(result, list) and len(result) > 0:
             document_db_id = result[0][0]
-        elif isinstance(result, int) and result > 0:
-            # For INSERT with RETURNING that's treated as INSERT, need to get the ID differently
-            # Let's use a SELECT query to get the last inserted ID
-            select_query = "SELECT id FROM documents WHERE stored_filename = %s ORDER BY id DESC LIMIT 1"
-            id_result, _ = safe_db_query(select_query, (stored_filename,))
-            if id_result and len(id_result) > 0:
-                document_db_id = id_result[0][0]
-            else:
-                logging.error(f"Failed to get document ID after insert for {stored_filename}")
-                continue
         else:
             logging.error(f"Failed to get document ID after insert for {stored_filename}")
+            try:
+                os.remove(file_path)
+            except OSError as del_e:
+                logging.warning(f"Failed to remove file {file_path}: {del_e}")
             continue
         
         # Chunk text and add to vector store using LangChain vectorstore with improved metadata
-        chunks = text_splitter.split_text(text)
+        chunks = _split_text(text)
         
         if chunks:
-            # Prepare documents for LangChain vectorstore
-            docs = []
-            
+            # Filter blank chunks once so chunk_total is not recomputed per chunk
+            valid_chunks = [c for c in chunks if c.strip()]
+            chunk_total = len(valid_chunks)
+            created_at = now.isoformat() if now else None
+
             display_name = document_name or document_source or ""
             prefix = f"{display_name}\n\n" if display_name else ""
-            for i, chunk in enumerate(chunks):
-                if chunk.strip():
-                    metadata = {
+            docs = [
+                Document(
+                    page_content=f"{prefix}{chunk}" if prefix else chunk,
+                    metadata={
                         "document_id": str(document_db_id),
                         "chat_id": None,
                         "source_type": "portal",
@@ -450,41 +540,25 @@ def pull_from_portal_logic(sync_logger=None):
                         "storage_path": storage_path,
                         "mime_type": mime_type,
                         "chunk_index": i,
-                        "chunk_total": len([c for c in chunks if c.strip()]),
-                        "created_at": now.isoformat() if now else None
-                    }
-                    content = f"{prefix}{chunk}" if prefix else chunk
-                    doc = Document(page_content=content, metadata=metadata)
-                    docs.append(doc)
+                        "chunk_total": chunk_total,
+                        "created_at": created_at
+                    },
+                )
+                for i, chunk in enumerate(valid_chunks)
+            ]
             
-            # Add to vector store using LangChain (handles embeddings automatically)
+            # Single add_documents call; PGVectorStore embeds the whole batch with one embed_documents request
             if docs:
                 try:
                     vectorstore.add_documents(docs)
                     logging.info(f"✅ Added {len(docs)} chunks to vector store for {stored_filename}")
-                    
-                    # Log successful processing
-                    if sync_logger:
-                        sync_logger.log_document_result(
-                            document_title=document_name,
-                            document_filename=orig_filename,
-                            document_id=str(document_id) if document_id else None,
-                            status='success',
-                            file_size=file_size,
-                            metadata={
-                                'stored_filename': stored_filename,
-                                'chunks_count': len(docs),
-                                'text_length': len(text)
-                            }
-                        )
-                        
                 except Exception as e:
                     error_msg = f"Failed to add chunks to vector store: {e}"
                     logging.error(f"❌ Failed to add chunks to vector store: {e}")
                     
                     # Log vector store failure
-                    if sync_logger:
-                        sync_logger.log_document_result(
+                    if _log:
+                        _log(
                             document_title=document_name,
                             document_filename=orig_filename,
                             document_id=str(document_id) if document_id else None,
@@ -494,25 +568,72 @@ def pull_from_portal_logic(sync_logger=None):
                             metadata={'error_type': 'vector_store_error'}
                         )
                     
-                    # Rollback: delete file and database record due to embedding failure
+                    # Rollback: the file was never moved, so only the download
+                    # and the database record need removing
                     try:
-                        os.remove(new_file_path)
-                        logging.info(f"✅ Deleted file {new_file_path} due to embedding failure")
+                        os.remove(file_path)
+                        logging.info(f"✅ Deleted file {file_path} due to embedding failure")
                     except Exception as del_e:
-                        logging.error(f"❌ Failed to delete file {new_file_path}: {del_e}")
+                        logging.error(f"❌ Failed to delete file {file_path}: {del_e}")
                     
                     try:
                         delete_query = "DELETE FROM documents WHERE id = %s"
-                        safe_db_query(delete_query, (document_db_id,))
+                        _safe_db_query(delete_query, (document_db_id,))
                         logging.info(f"✅ Deleted database record for {stored_filename} due to embedding failure")
                     except Exception as del_e:
                         logging.error(f"❌ Failed to delete database record for {stored_filename}: {del_e}")
                     # Continue to next document
                     continue
+
+                if not _promote_stored_file(document_db_id, file_path, new_file_path):
+                    # Undo the embedding and the row so nothing references the UUID name
+                    try:
+                        vectorstore.delete_by_metadata({"stored_filename": stored_filename})
+                        _safe_db_query("DELETE FROM documents WHERE id = %s", (document_db_id,))
+                    except Exception as del_e:
+                        logging.error(f"❌ Failed to roll back {stored_filename}: {del_e}")
+                    try:
+                        os.remove(file_path)
+                    except OSError as del_e:
+                        logging.warning(f"Failed to remove downloaded file {file_path}: {del_e}")
+                    if _log:
+                        _log(
+                            document_title=document_name,
+                            document_filename=orig_filename,
+                            document_id=str(document_id) if document_id else None,
+                            status='failed',
+                            error_message=f"Failed to move file to stored filename {stored_filename}",
+                            file_size=file_size,
+                            metadata={'error_type': 'file_move_error'}
+                        )
+                    continue
+                existing_files.add(stored_filename)
+
+                existing_by_filename[orig_filename] = (
+                    document_source, stored_filename, document_db_id, storage_path
+                )
+                vec_counts[str(document_db_id)] = len(docs)
+                
+                # Log successful processing
+                if _log:
+                    _log(
+                        document_title=document_name,
+                        document_filename=orig_filename,
+                        document_id=str(document_id) if document_id else None,
+                        status='success',
+                        file_size=file_size,
+                        metadata={
+                            'stored_filename': stored_filename,
+                            'chunks_count': len(docs),
+                            'text_length': len(text)
+                        }
+                    )
         else:
             # No text extracted but file was saved - log as partial success
-            if sync_logger:
-                sync_logger.log_document_result(
+            if _promote_stored_file(document_db_id, file_path, new_file_path):
+                existing_files.add(stored_filename)
+            if _log:
+                _log(
                     document_title=document_name,
                     document_filename=orig_filename,
                     document_id=str(document_id) if document_id else None,
@@ -522,9 +643,10 @@ def pull_from_portal_logic(sync_logger=None):
                     metadata={'error_type': 'no_text_extracted'}
                 )
             continue
-        
+
         # Update document_source for downloaded list to use stored_filename
         document_source = stored_filename
+
     # Return response with consistent structure
     return {
         "message": "Success pull from portal",
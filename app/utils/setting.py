@@ -9,13 +9,42 @@ from .env_loader import env_load
 env_load()
 
 import base64
+import copy
 import logging
 import os
-from typing import Optional, Tuple
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 import json
 from Crypto.Cipher import AES
 
 
+# Process-local cache of resolved setting values: name -> (fetched_at, value).
+# Settings change rarely, so hot paths (API key, prompts) avoid a DB round-trip per call.
+_settings_cache: Dict[str, Tuple[float, Any]] = {}
+_settings_cache_lock = threading.Lock()
+_SETTINGS_TTL = float(os.getenv("SETTINGS_CACHE_TTL", "60"))
+
+# Cheap shape check so non-base64 values skip the b64decode attempt
+_B64_RE = re.compile(r'^[A-Za-z0-9+/]+={0,2}$')
+
+# AES key/IV come from the environment and never change within a process
+_KEY_IV_CACHE: Optional[Tuple[bytes, bytes]] = None
+
+
+def _get_cached_key_iv() -> Tuple[Optional[bytes], Optional[bytes]]:
+    """Return the AES key/IV pair, decoding it from the environment only once."""
+    global _KEY_IV_CACHE
+    if _KEY_IV_CACHE is None:
+        key, iv = get_key_iv(require=False)
+        if not key or not iv:
+            # Do not cache a missing configuration; env may be loaded later.
+            return None, None
+        _KEY_IV_CACHE = (key, iv)
+    return _KEY_IV_CACHE
+
+
 def resolve_api_key_value(raw_value: Optional[str]) -> Tuple[Optional[str], bool]:
     """Return decrypted API key (if encrypted) and flag indicating encryption."""
     if not raw_value or not isinstance(raw_value, str):
@@ -31,6 +60,10 @@ def resolve_api_key_value(raw_value: Optional[str]) -> Tuple[Optional[str], bool
     if len(candidate) % 4 != 0:
         return None, True
 
+    if not _B64_RE.match(candidate):
+        # Not base64 → treat as plain text
+        return None, False
+
     try:
         decoded_bytes = base64.b64decode(candidate, validate=True)
     except Exception:
@@ -76,11 +109,12 @@ def mask_api_key(value: Optional[str]) -> str:
 
 def _try_decrypt_api_key(cipher_bytes: bytes) -> Optional[str]:
     """Best-effort AES-CBC decryption without logging warnings."""
-    key, iv = get_key_iv(require=False)
+    key, iv = _get_cached_key_iv()
     if not key or not iv:
         return None
 
     try:
+        # CBC cipher objects are stateful, so a fresh one is needed per decrypt
         cipher = AES.new(key, AES.MODE_CBC, iv)
         decrypted = cipher.decrypt(cipher_bytes)
         pad_len = decrypted[-1]
@@ -91,7 +125,16 @@ def _try_decrypt_api_key(cipher_bytes: bytes) -> Optional[str]:
     except Exception:
         return None
 
-def get_setting_value_by_name(setting_name):
+def invalidate_setting(setting_name: Optional[str] = None) -> None:
+    """Drop a cached setting value, or the whole cache when no name is given."""
+    with _settings_cache_lock:
+        if setting_name is None:
+            _settings_cache.clear()
+        else:
+            _settings_cache.pop(setting_name, None)
+
+
+def _query_setting_value(setting_name):
     sel_query = """
         SELECT 
             id,
@@ -105,53 +148,69 @@ def get_setting_value_by_name(setting_name):
         FROM settings
         WHERE name = %s
     """
-    try:
-        results, _ = safe_db_query(sel_query, [setting_name])
-        
-        setting = (
-            tuple(results[0])
-            if results and isinstance(results, list) and len(results) > 0
-            else None
-        )
+    results, _ = safe_db_query(sel_query, [setting_name])
+
+    setting = (
+        tuple(results[0])
+        if results and isinstance(results, list) and len(results) > 0
+        else None
+    )
+
+    if not setting or not setting[6]:
+        return None
 
-        if not setting or not setting[6]:
+    raw_value = setting[6]
+
+    if to_snake_case(setting_name) == 'api_key':
+        resolved_value, _ = resolve_api_key_value(raw_value)
+        v = resolved_value
+    else:
+        v = raw_value
+
+    if v is not None:
+        try:
+            dtype = (setting[4] or '').strip().lower()
+            if dtype == 'boolean':
+                # accept 1/0, true/false strings, bool
+                if isinstance(v, bool):
+                    v = v
+                elif isinstance(v, (int, float)):
+                    v = bool(int(v))
+                elif isinstance(v, str):
+                    v = v.strip().lower() in ('1', 'true', 'yes')
+            elif dtype == 'integer':
+                if isinstance(v, (int, float)):
+                    v = int(v)
+                elif isinstance(v, str) and v.strip().lstrip('-').isdigit():
+                    v = int(v)
+            elif dtype in ('array', 'object'):
+                v = json.loads(str(v))
+
+            return v
+        except Exception:
             return None
 
-        raw_value = setting[6]
+    return None
 
-        if to_snake_case(setting_name) == 'api_key':
-            resolved_value, _ = resolve_api_key_value(raw_value)
-            v = resolved_value
-        else:
-            v = raw_value
-
-        if v is not None:
-            try:
-                dtype = (setting[4] or '').strip().lower()
-                if dtype == 'boolean':
-                    # accept 1/0, true/false strings, bool
-                    if isinstance(v, bool):
-                        v = v
-                    elif isinstance(v, (int, float)):
-                        v = bool(int(v))
-                    elif isinstance(v, str):
-                        v = v.strip().lower() in ('1', 'true', 'yes')
-                elif dtype == 'integer':
-                    if isinstance(v, (int, float)):
-                        v = int(v)
-                    elif isinstance(v, str) and v.strip().lstrip('-').isdigit():
-                        v = int(v)
-                elif dtype in ('array', 'object'):
-                    v = json.loads(str(v))
-
-                return v
-            except Exception:
-                return None
 
-        return None
+def get_setting_value_by_name(setting_name):
+    now = time.monotonic()
+    with _settings_cache_lock:
+        cached = _settings_cache.get(setting_name)
+    if cached is not None and now - cached[0] < _SETTINGS_TTL:
+        v = cached[1]
+    else:
+        try:
+            v = _query_setting_value(setting_name)
+        except Exception as e:
+            return None
+        with _settings_cache_lock:
+            _settings_cache[setting_name] = (now, v)
 
-    except Exception as e:
-        return None
+    # Hand out copies of containers so callers cannot mutate the cached value
+    if isinstance(v, (list, dict)):
+        return copy.deepcopy(v)
+    return v
         
 
 def get_openai_api_key() -> str:
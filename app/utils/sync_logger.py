@@ -3,13 +3,203 @@ Utilities for logging document synchronization operations and results.
 """
 from __future__ import annotations
 
-import json
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from app.utils.database import safe_db_query
+import orjson
+from psycopg2.extras import Json, execute_batch
+
+from app.utils.database import getConnection, safe_db_query
+from app.utils.time_provider import get_current_datetime
+
+# sync_log_details rows are written by a background worker in batches of up
+# to DETAIL_FLUSH_SIZE rows, waiting at most DETAIL_FLUSH_INTERVAL seconds
+DETAIL_FLUSH_SIZE = 100
+DETAIL_FLUSH_INTERVAL = 0.5
+
+# Queue marker that stops the detail worker
+_STOP_WORKER = object()
+
+# Server-side prepared inserts used by the detail worker, keyed by whether
+# sync_log_details has the website item columns. processed_at is passed
+# explicitly: rows are written in batches, and the column default would give
+# a whole batch its transaction's start time instead of each item's time.
+_DETAIL_INSERT_STATEMENTS = {
+    True: (
+        'sync_log_detail_ins',
+        """
+            PREPARE sync_log_detail_ins AS
+            INSERT INTO sync_log_details (
+                sync_log_id, item_type, item_url, item_source,
+                document_title, document_filename, document_id,
+                status, error_message, file_size, metadata, processed_at
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+        """,
+        'EXECUTE sync_log_detail_ins (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)',
+    ),
+    False: (
+        'sync_log_detail_ins_legacy',
+        """
+            PREPARE sync_log_detail_ins_legacy AS
+            INSERT INTO sync_log_details (
+                sync_log_id, document_title, document_filename,
+                document_id, status, error_message, file_size, metadata,
+                processed_at
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+        """,
+        'EXECUTE sync_log_detail_ins_legacy (%s, %s, %s, %s, %s, %s, %s, %s, %s)',
+    ),
+}
+
+# Bounds for the failure lists kept in sync_logs.metadata; the full set of
+# failures is always available in sync_log_details
+FAILED_ITEMS_METADATA_LIMIT = 500
+FAILED_ERROR_MAX_CHARS = 2048
+
+# Optional schema features added by later migrations, probed once per process
+SYNC_LOGS_WEBSITE_COLUMNS = 'sync_logs.website_columns'
+SYNC_LOG_DETAILS_ITEM_COLUMNS = 'sync_log_details.item_columns'
+_SCHEMA_CAP_COLUMNS: Dict[str, Tuple[str, str]] = {
+    SYNC_LOGS_WEBSITE_COLUMNS: ('sync_logs', 'total_website_documents'),
+    SYNC_LOG_DETAILS_ITEM_COLUMNS: ('sync_log_details', 'item_type'),
+}
+_SCHEMA_CAPS: Dict[str, bool] = {}
+
+
+# Search filter for sync log listings, built once per schema variant
+_DETAIL_SEARCH_LEGACY = (
+    "sld.document_id ILIKE %s"
+    " OR sld.document_title ILIKE %s"
+    " OR sld.document_filename ILIKE %s"
+    " OR sld.error_message ILIKE %s"
+)
+_DETAIL_SEARCH_WITH_WEB = (
+    _DETAIL_SEARCH_LEGACY
+    + " OR sld.item_url ILIKE %s"
+    + " OR sld.item_source ILIKE %s"
+)
+
+
+def _build_search_clause(detail_search: str) -> str:
+    return f"""
+                (
+                    sl.error_message ILIKE %s
+                    OR sl.triggered_by ILIKE %s
+                    OR CAST(sl.id AS TEXT) ILIKE %s
+                    OR EXISTS (
+                        SELECT 1
+                        FROM sync_log_details sld
+                        WHERE sld.sync_log_id = sl.id
+                          AND (
+                              {detail_search}
+                          )
+                    )
+                )
+                """
+
+
+_SEARCH_CLAUSE_WITH_WEB = _build_search_clause(_DETAIL_SEARCH_WITH_WEB)
+_SEARCH_CLAUSE_LEGACY = _build_search_clause(_DETAIL_SEARCH_LEGACY)
+_SEARCH_PARAMS_WITH_WEB = _SEARCH_CLAUSE_WITH_WEB.count('%s')
+_SEARCH_PARAMS_LEGACY = _SEARCH_CLAUSE_LEGACY.count('%s')
+
+
+@lru_cache(maxsize=64)
+def _sync_log_where_clause(
+    has_sync_type: bool,
+    status_kind: Optional[str],
+    has_search: bool,
+    has_start_date: bool,
+    has_end_date: bool,
+    include_website_columns: bool,
+) -> str:
+    """
+    Build the WHERE clause template for the sync log filters in use.
+    
+    The SQL only depends on which filters are set, so it is cached; the
+    filter values are passed as parameters in the same order.
+    """
+    where_conditions = []
+
+    if has_sync_type:
+        where_conditions.append('sl.sync_type = %s')
+
+    if status_kind == 'success':
+        where_conditions.append("sl.status IN ('success', 'succeeded')")
+    elif status_kind:
+        where_conditions.append('sl.status = %s')
+
+    if has_start_date:
+        where_conditions.append('sl.started_at >= %s')
+
+    if has_end_date:
+        where_conditions.append('sl.started_at <= %s')
+
+    if has_search:
+        where_conditions.append(
+            _SEARCH_CLAUSE_WITH_WEB if include_website_columns else _SEARCH_CLAUSE_LEGACY
+        )
+
+    if not where_conditions:
+        return ''
+    return ' WHERE ' + ' AND '.join(where_conditions)
+
+
+def _summary_error(error_message: Optional[str]) -> Optional[str]:
+    """Trim an error message for the summary metadata."""
+    if isinstance(error_message, str) and len(error_message) > FAILED_ERROR_MAX_CHARS:
+        return error_message[:FAILED_ERROR_MAX_CHARS] + '...'
+    return error_message
+
+
+class _MetadataJson(Json):
+    """psycopg2 Json adapter for jsonb metadata, encoded with orjson."""
+
+    def dumps(self, obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _schema_cap(key: str) -> bool:
+    """
+    Return whether an optional schema feature is available.
+    
+    The first call per key checks information_schema; the answer is cached so
+    later queries pick the right SQL instead of failing and rolling back.
+    """
+    cached = _SCHEMA_CAPS.get(key)
+    if cached is not None:
+        return cached
+
+    table, column = _SCHEMA_CAP_COLUMNS[key]
+    try:
+        rows, _ = safe_db_query(
+            """
+                SELECT 1
+                FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = %s
+                  AND column_name = %s
+                LIMIT 1
+            """,
+            (table, column),
+        )
+    except Exception as exc:
+        # Do not cache probe failures; assume the current schema meanwhile
+        logging.warning(f"Failed to probe schema capability {key}: {exc}")
+        return True
+
+    _SCHEMA_CAPS[key] = bool(rows) and isinstance(rows, list)
+    if not _SCHEMA_CAPS[key]:
+        logging.warning(f"Using legacy sync log schema ({key} unavailable)")
+    return _SCHEMA_CAPS[key]
 
 
 class SyncLogger:
@@ -17,7 +207,21 @@ class SyncLogger:
     
     def __init__(self):
         self.sync_log_id: Optional[str] = None
-        self.document_results: List[Dict[str, Any]] = []
+        # Per-type result counters and the failures for the summary metadata;
+        # counting as items are logged keeps the summary correct even if a
+        # sync_log_details batch fails to write
+        self.failed_documents: List[Dict[str, Any]] = []
+        self.failed_website_items: List[Dict[str, Any]] = []
+        self._failed_documents_omitted = 0
+        self._failed_website_items_omitted = 0
+        self._result_counts = self._empty_result_counts()
+        self._detail_queue: "queue.Queue[Any]" = queue.Queue()
+        self._detail_worker: Optional[threading.Thread] = None
+        self._detail_worker_lock = threading.Lock()
+        self._detail_write_failed = False
+        # Connection owned by the detail worker, with the insert prepared on it
+        self._detail_conn = None
+        self._detail_prepared: Optional[str] = None
         
     def start_sync_log(
         self,
@@ -48,14 +252,14 @@ class SyncLogger:
                 RETURNING id
             """
             
-            metadata_json = json.dumps(metadata or {})
+            metadata_param = _MetadataJson(metadata or {})
             
             result, _ = safe_db_query(insert_query, (
                 sync_type,
                 'running',
                 trigger_source,
                 triggered_by,
-                metadata_json
+                metadata_param
             ))
             
             if result and isinstance(result, list) and len(result) > 0:
@@ -90,7 +294,7 @@ class SyncLogger:
             document_title: Title of the document
             document_filename: Original filename
             document_id: Document ID from portal or system
-            status: Processing status (success, failed)
+            status: Processing status (success, failed, skipped)
             error_message: Error message if failed
             file_size: File size in bytes
             metadata: Additional document metadata
@@ -103,69 +307,47 @@ class SyncLogger:
             return False
             
         try:
-            insert_query = """
-                INSERT INTO sync_log_details (
-                    sync_log_id,
-                    item_type,
-                    item_url,
-                    item_source,
-                    document_title,
-                    document_filename,
-                    document_id,
-                    status,
-                    error_message,
-                    file_size,
-                    metadata
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            metadata_json = json.dumps(metadata or {})
+            # Rows are queued for the background writer thread, which inserts
+            # them in batches; flush() waits until the queue is drained
+            self._enqueue_detail_rows([(
+                self.sync_log_id,
+                item_type,
+                item_url,
+                item_source,
+                document_title,
+                document_filename,
+                document_id,
+                status,
+                error_message,
+                file_size,
+                _MetadataJson(metadata or {}),
+                get_current_datetime()
+            )])
             
-            try:
-                safe_db_query(insert_query, (
-                    self.sync_log_id,
-                    item_type,
-                    item_url,
-                    item_source,
-                    document_title,
-                    document_filename,
-                    document_id,
-                    status,
-                    error_message,
-                    file_size,
-                    metadata_json
-                ))
-            except Exception:
-                # Backwards compatibility for databases that haven't applied
-                # the website logging migration yet.
-                fallback_query = """
-                    INSERT INTO sync_log_details (
-                        sync_log_id, document_title, document_filename,
-                        document_id, status, error_message, file_size, metadata
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                safe_db_query(fallback_query, (
-                    self.sync_log_id,
-                    document_title,
-                    document_filename,
-                    document_id,
-                    status,
-                    error_message,
-                    file_size,
-                    metadata_json
-                ))
-            
-            # Track results for summary
-            self.document_results.append({
-                'status': status,
-                'item_type': item_type,
-                'item_url': item_url,
-                'document_title': document_title,
-                'document_filename': document_filename,
-                'error_message': error_message
-            })
+            normalized_type = item_type or 'document'
+            self._count_result(normalized_type, status)
+
+            # Track failures for the summary metadata
+            if status == 'failed':
+                if normalized_type == 'document':
+                    if len(self.failed_documents) < FAILED_ITEMS_METADATA_LIMIT:
+                        self.failed_documents.append({
+                            'title': document_title,
+                            'filename': document_filename,
+                            'url': item_url,
+                            'error': _summary_error(error_message)
+                        })
+                    else:
+                        self._failed_documents_omitted += 1
+                elif normalized_type == 'website':
+                    if len(self.failed_website_items) < FAILED_ITEMS_METADATA_LIMIT:
+                        self.failed_website_items.append({
+                            'title': document_title or item_url,
+                            'url': item_url,
+                            'error': _summary_error(error_message)
+                        })
+                    else:
+                        self._failed_website_items_omitted += 1
             
             return True
             
@@ -173,6 +355,138 @@ class SyncLogger:
             logging.error(f"Error logging document result: {e}")
             return False
     
+    def _enqueue_detail_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        """Hand sync_log_details rows to the background worker."""
+        with self._detail_worker_lock:
+            if self._detail_worker is None or not self._detail_worker.is_alive():
+                self._detail_worker = threading.Thread(
+                    target=self._run_detail_worker,
+                    name="SyncLogDetailWriter",
+                    daemon=True,
+                )
+                self._detail_worker.start()
+        for row in rows:
+            self._detail_queue.put_nowait(row)
+
+    def _run_detail_worker(self) -> None:
+        """Drain the detail queue in batches until the stop marker arrives."""
+        stop = False
+        while not stop:
+            item = self._detail_queue.get()
+            if item is _STOP_WORKER:
+                self._detail_queue.task_done()
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + DETAIL_FLUSH_INTERVAL
+            while len(batch) < DETAIL_FLUSH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._detail_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP_WORKER:
+                    self._detail_queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self._insert_detail_rows(batch)
+            except Exception as e:
+                self._detail_write_failed = True
+                logging.error(f"Error writing {len(batch)} sync log details: {e}")
+                self._close_detail_conn()
+            finally:
+                for _ in batch:
+                    self._detail_queue.task_done()
+
+        self._close_detail_conn()
+
+    def flush(self) -> bool:
+        """
+        Wait until every queued sync_log_details row has been written.
+        
+        Returns:
+            True if all rows since the last flush were written, False otherwise
+        """
+        if self._detail_worker is None:
+            return True
+
+        self._detail_queue.join()
+        ok = not self._detail_write_failed
+        self._detail_write_failed = False
+        return ok
+
+    def _stop_detail_worker(self) -> None:
+        """Flush and stop the background worker."""
+        with self._detail_worker_lock:
+            worker = self._detail_worker
+            self._detail_worker = None
+        if worker is None:
+            return
+        self._detail_queue.put_nowait(_STOP_WORKER)
+        worker.join()
+
+    def _insert_detail_rows(self, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Insert sync_log_details rows through the worker's prepared statement.
+        
+        The statement is prepared once per worker connection; execute_batch
+        then sends the EXECUTE calls for a whole batch in one round-trip.
+        """
+        with_item_columns = _schema_cap(SYNC_LOG_DETAILS_ITEM_COLUMNS)
+        name, prepare_query, execute_query = _DETAIL_INSERT_STATEMENTS[with_item_columns]
+        if not with_item_columns:
+            # Backwards compatibility for databases that haven't applied
+            # the website logging migration yet.
+            rows = [(r[0],) + tuple(r[4:]) for r in rows]
+
+        if self._detail_conn is None:
+            self._detail_conn = getConnection()
+            self._detail_prepared = None
+
+        try:
+            with self._detail_conn.cursor() as cursor:
+                if self._detail_prepared != name:
+                    cursor.execute(prepare_query)
+                    self._detail_prepared = name
+                execute_batch(cursor, execute_query, rows, page_size=DETAIL_FLUSH_SIZE)
+            self._detail_conn.commit()
+        except Exception:
+            self._detail_conn.rollback()
+            raise
+
+    def _close_detail_conn(self) -> None:
+        """Close the worker connection; its prepared statement goes with it."""
+        conn = self._detail_conn
+        self._detail_conn = None
+        self._detail_prepared = None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _empty_result_counts() -> Dict[Tuple[str, str], int]:
+        """Zeroed counters keyed by (item_type, status), plus 'total' per type."""
+        return {
+            (item_type, key): 0
+            for item_type in ('document', 'website')
+            for key in ('total', 'success', 'failed')
+        }
+
+    def _count_result(self, item_type: str, status: str) -> None:
+        """Mirror one logged detail row in the in-memory counters."""
+        if (item_type, 'total') not in self._result_counts:
+            return
+        self._result_counts[(item_type, 'total')] += 1
+        if status in ('success', 'failed'):
+            self._result_counts[(item_type, status)] += 1
+
     def finish_sync_log(
         self,
         status: str = 'success',
@@ -196,23 +510,24 @@ class SyncLogger:
             logging.warning("Cannot finish sync log: no active sync log")
             return False
             
+        # Persist any queued detail rows before writing the summary
+        if not self.flush():
+            logging.warning(f"Some sync log details for {self.sync_log_id} were not written")
+        self._stop_detail_worker()
+
         try:
             normalized_status = (status or '').strip().lower()
             if normalized_status == 'succeeded':
                 normalized_status = 'success'
 
-            # Calculate statistics per item type
-            items = self.document_results or []
-            document_items = [r for r in items if (r.get('item_type') or 'document') == 'document']
-            website_items = [r for r in items if (r.get('item_type') or 'document') == 'website']
-
-            total_documents = len(document_items)
-            successful_documents = len([r for r in document_items if r.get('status') == 'success'])
-            failed_documents = len([r for r in document_items if r.get('status') == 'failed'])
-
-            total_website_documents = len(website_items)
-            successful_website_documents = len([r for r in website_items if r.get('status') == 'success'])
-            failed_website_documents = len([r for r in website_items if r.get('status') == 'failed'])
+            # Statistics per item type, counted as results were logged
+            counts = self._result_counts
+            total_documents = counts[('document', 'total')]
+            successful_documents = counts[('document', 'success')]
+            failed_documents = counts[('document', 'failed')]
+            total_website_documents = counts[('website', 'total')]
+            successful_website_documents = counts[('website', 'success')]
+            failed_website_documents = counts[('website', 'failed')]
 
             failed_total = failed_documents + failed_website_documents
             successful_total = successful_documents + successful_website_documents
@@ -241,24 +556,20 @@ class SyncLogger:
                     'successful': successful_total,
                     'failed': failed_total,
                 },
-                'failed_documents': [
-                    {
-                        'title': r['document_title'],
-                        'filename': r['document_filename'],
-                        'url': r.get('item_url'),
-                        'error': r['error_message']
-                    }
-                    for r in document_items if r.get('status') == 'failed'
-                ],
-                'failed_website_items': [
-                    {
-                        'title': r.get('document_title') or r.get('item_url'),
-                        'url': r.get('item_url'),
-                        'error': r.get('error_message')
-                    }
-                    for r in website_items if r.get('status') == 'failed'
-                ]
             }
+            # Failure lists are only stored when there is something in them;
+            # clean syncs skip encoding empty lists (the API reads failures
+            # from sync_log_details, not from this summary)
+            if self.failed_documents:
+                final_metadata['failed_documents'] = self.failed_documents
+            if self.failed_website_items:
+                final_metadata['failed_website_items'] = self.failed_website_items
+            if self._failed_documents_omitted:
+                final_metadata['failed_documents_truncated'] = True
+                final_metadata['failed_documents_omitted'] = self._failed_documents_omitted
+            if self._failed_website_items_omitted:
+                final_metadata['failed_website_items_truncated'] = True
+                final_metadata['failed_website_items_omitted'] = self._failed_website_items_omitted
             
             if additional_metadata:
                 final_metadata.update(additional_metadata)
@@ -280,9 +591,9 @@ class SyncLogger:
                 WHERE id = %s
             """
             
-            metadata_json = json.dumps(final_metadata)
+            metadata_param = _MetadataJson(final_metadata)
             
-            try:
+            if _schema_cap(SYNC_LOGS_WEBSITE_COLUMNS):
                 safe_db_query(update_query, (
                     normalized_status,
                     total_documents,
@@ -293,10 +604,10 @@ class SyncLogger:
                     failed_website_documents,
                     runtime_seconds,
                     error_message,
-                    metadata_json,
+                    metadata_param,
                     self.sync_log_id
                 ))
-            except Exception:
+            else:
                 # Backwards compatibility when website aggregate columns are missing.
                 fallback_update = """
                     UPDATE sync_logs
@@ -318,7 +629,7 @@ class SyncLogger:
                     failed_documents,
                     runtime_seconds,
                     error_message,
-                    metadata_json,
+                    metadata_param,
                     self.sync_log_id
                 ))
             
@@ -329,7 +640,11 @@ class SyncLogger:
             
             # Reset for next use
             self.sync_log_id = None
-            self.document_results = []
+            self.failed_documents = []
+            self.failed_website_items = []
+            self._failed_documents_omitted = 0
+            self._failed_website_items_omitted = 0
+            self._result_counts = self._empty_result_counts()
             
             return True
             
@@ -346,71 +661,42 @@ class SyncLogger:
         end_date: Optional[datetime] = None,
         include_website_columns: bool = True,
     ) -> Tuple[str, List[Any]]:
-        where_conditions = []
         params: List[Any] = []
 
         if sync_type:
-            where_conditions.append('sl.sync_type = %s')
             params.append(sync_type)
 
+        status_kind = None
         if status:
             normalized_status = str(status).strip().lower()
-            if normalized_status == 'success':
-                where_conditions.append("sl.status IN ('success', 'succeeded')")
-            elif normalized_status == 'succeeded':
-                where_conditions.append("sl.status IN ('success', 'succeeded')")
+            if normalized_status in ('success', 'succeeded'):
+                status_kind = 'success'
             else:
-                where_conditions.append('sl.status = %s')
+                status_kind = 'value'
                 params.append(normalized_status)
 
         if start_date:
-            where_conditions.append('sl.started_at >= %s')
             params.append(start_date)
 
         if end_date:
-            where_conditions.append('sl.started_at <= %s')
             params.append(end_date)
 
+        include_website_columns = bool(include_website_columns)
         if search:
             search_term = f"%{search}%"
-
-            detail_search_conditions = [
-                "sld.document_id ILIKE %s",
-                "sld.document_title ILIKE %s",
-                "sld.document_filename ILIKE %s",
-                "sld.error_message ILIKE %s",
-            ]
-            detail_param_count = 4
             if include_website_columns:
-                detail_search_conditions.extend([
-                    "sld.item_url ILIKE %s",
-                    "sld.item_source ILIKE %s",
-                ])
-                detail_param_count += 2
-
-            where_conditions.append(
-                f"""
-                (
-                    sl.error_message ILIKE %s
-                    OR sl.triggered_by ILIKE %s
-                    OR CAST(sl.id AS TEXT) ILIKE %s
-                    OR EXISTS (
-                        SELECT 1
-                        FROM sync_log_details sld
-                        WHERE sld.sync_log_id = sl.id
-                          AND (
-                              {' OR '.join(detail_search_conditions)}
-                          )
-                    )
-                )
-                """
-            )
-            params.extend([search_term] * (3 + detail_param_count))
-
-        where_clause = ''
-        if where_conditions:
-            where_clause = ' WHERE ' + ' AND '.join(where_conditions)
+                params.extend([search_term] * _SEARCH_PARAMS_WITH_WEB)
+            else:
+                params.extend([search_term] * _SEARCH_PARAMS_LEGACY)
 
+        where_clause = _sync_log_where_clause(
+            bool(sync_type),
+            status_kind,
+            bool(search),
+            bool(start_date),
+            bool(end_date),
+            include_website_columns,
+        )
         return where_clause, params
 
     @staticmethod
@@ -421,11 +707,16 @@ class SyncLogger:
         status: Optional[str] = None,
         search: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cursor_started_at: Optional[datetime] = None,
+        cursor_id: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Retrieve sync logs with pagination and filtering.
         
+        When both cursor values are given, the page starts right after that
+        log (keyset pagination) and ``page`` is ignored.
+        
         Args:
             page: Page number (1-based)
             page_size: Number of logs per page
@@ -434,6 +725,8 @@ class SyncLogger:
             search: Search term for logs and details
             start_date: Filter logs starting from this date
             end_date: Filter logs up to this date
+            cursor_started_at: started_at of the last log of the previous page
+            cursor_id: id of the last log of the previous page
             
         Returns:
             Tuple of (logs list, total count)
@@ -445,45 +738,58 @@ class SyncLogger:
                 search=search,
                 start_date=start_date,
                 end_date=end_date,
-                include_website_columns=include_website_fields,
+                include_website_columns=_schema_cap(SYNC_LOG_DETAILS_ITEM_COLUMNS),
             )
 
-            count_query = f'SELECT COUNT(*) FROM sync_logs sl{where_clause}'
-            count_result, _ = safe_db_query(count_query, params)
-            total = count_result[0][0] if count_result and isinstance(count_result, list) else 0
+            use_cursor = cursor_started_at is not None and bool(cursor_id)
+            page_where = where_clause
+            query_params = list(params)
+            if use_cursor:
+                page_where += ' AND ' if where_clause else ' WHERE '
+                page_where += '(sl.started_at, sl.id) < (%s, %s::uuid)'
+                query_params.extend([cursor_started_at, cursor_id])
+                pagination = 'LIMIT %s'
+                query_params.append(page_size)
+            else:
+                pagination = 'LIMIT %s OFFSET %s'
+                query_params.extend([page_size, (page - 1) * page_size])
 
             if include_website_fields:
                 query = f"""
-                    SELECT sl.id, sl.sync_type, sl.status,
+                    SELECT sl.id::text, sl.sync_type, sl.status,
                            sl.total_documents, sl.successful_documents, sl.failed_documents,
                            sl.total_website_documents, sl.successful_website_documents, sl.failed_website_documents,
                            sl.trigger_source, sl.triggered_by, sl.started_at,
-                           sl.finished_at, sl.runtime_seconds, sl.error_message, sl.metadata
-                    FROM sync_logs sl{where_clause}
-                    ORDER BY sl.started_at DESC
-                    LIMIT %s OFFSET %s
+                           sl.finished_at, sl.runtime_seconds, sl.error_message,
+                           COUNT(*) OVER () AS _total
+                    FROM sync_logs sl{page_where}
+                    ORDER BY sl.started_at DESC, sl.id DESC
+                    {pagination}
                 """
             else:
                 query = f"""
-                    SELECT sl.id, sl.sync_type, sl.status,
+                    SELECT sl.id::text, sl.sync_type, sl.status,
                            sl.total_documents, sl.successful_documents, sl.failed_documents,
                            sl.trigger_source, sl.triggered_by, sl.started_at,
-                           sl.finished_at, sl.runtime_seconds, sl.error_message, sl.metadata
-                    FROM sync_logs sl{where_clause}
-                    ORDER BY sl.started_at DESC
-                    LIMIT %s OFFSET %s
+                           sl.finished_at, sl.runtime_seconds, sl.error_message,
+                           COUNT(*) OVER () AS _total
+                    FROM sync_logs sl{page_where}
+                    ORDER BY sl.started_at DESC, sl.id DESC
+                    {pagination}
                 """
 
-            query_params = list(params)
-            query_params.extend([page_size, (page - 1) * page_size])
             result, _ = safe_db_query(query, query_params)
 
             logs: List[Dict[str, Any]] = []
+            total = 0
+            if result and isinstance(result, list) and not use_cursor:
+                # Every row carries the unpaginated total from the window count
+                total = result[0][-1]
             if result and isinstance(result, list):
                 for row in result:
                     if include_website_fields:
                         log_data = {
-                            'id': str(row[0]),
+                            'id': row[0],
                             'sync_type': row[1],
                             'status': row[2],
                             'total_documents': row[3],
@@ -498,11 +804,10 @@ class SyncLogger:
                             'finished_at': row[12].isoformat() if row[12] else None,
                             'runtime_seconds': row[13],
                             'error_message': row[14],
-                            'metadata': row[15],
                         }
                     else:
                         log_data = {
-                            'id': str(row[0]),
+                            'id': row[0],
                             'sync_type': row[1],
                             'status': row[2],
                             'total_documents': row[3],
@@ -517,21 +822,22 @@ class SyncLogger:
                             'finished_at': row[9].isoformat() if row[9] else None,
                             'runtime_seconds': row[10],
                             'error_message': row[11],
-                            'metadata': row[12],
                         }
                     logs.append(log_data)
+            if use_cursor or (not logs and page > 1):
+                # The window count only covers rows after the cursor, and a
+                # page past the end has no rows to carry it
+                count_query = f'SELECT COUNT(*) FROM sync_logs sl{where_clause}'
+                count_result, _ = safe_db_query(count_query, params)
+                total = count_result[0][0] if count_result and isinstance(count_result, list) else 0
 
             return logs, total
 
         try:
-            return _query_with_schema(True)
+            return _query_with_schema(_schema_cap(SYNC_LOGS_WEBSITE_COLUMNS))
         except Exception as exc:
-            logging.warning("Falling back to legacy sync_logs schema: %s", exc)
-            try:
-                return _query_with_schema(False)
-            except Exception as final_exc:
-                logging.error(f"Error retrieving sync logs: {final_exc}")
-                return [], 0
+            logging.error(f"Error retrieving sync logs: {exc}")
+            return [], 0
 
     @staticmethod
     def delete_sync_logs(
@@ -547,31 +853,17 @@ class SyncLogger:
         Returns:
             Number of deleted log entries.
         """
-        try:
-            where_clause, params = SyncLogger._build_sync_log_filters(
-                sync_type=sync_type,
-                status=status,
-                search=search,
-                start_date=start_date,
-                end_date=end_date,
-                include_website_columns=True,
-            )
-            query = f"DELETE FROM sync_logs sl{where_clause}"
-            deleted_count, _ = safe_db_query(query, params)
-            return deleted_count if isinstance(deleted_count, int) else 0
-        except Exception as exc:
-            logging.warning("Falling back to legacy delete filters for sync_logs: %s", exc)
-            where_clause, params = SyncLogger._build_sync_log_filters(
-                sync_type=sync_type,
-                status=status,
-                search=search,
-                start_date=start_date,
-                end_date=end_date,
-                include_website_columns=False,
-            )
-            query = f"DELETE FROM sync_logs sl{where_clause}"
-            deleted_count, _ = safe_db_query(query, params)
-            return deleted_count if isinstance(deleted_count, int) else 0
+        where_clause, params = SyncLogger._build_sync_log_filters(
+            sync_type=sync_type,
+            status=status,
+            search=search,
+            start_date=start_date,
+            end_date=end_date,
+            include_website_columns=_schema_cap(SYNC_LOG_DETAILS_ITEM_COLUMNS),
+        )
+        query = f"DELETE FROM sync_logs sl{where_clause}"
+        deleted_count, _ = safe_db_query(query, params)
+        return deleted_count if isinstance(deleted_count, int) else 0
     
     @staticmethod
     def get_sync_log_details(sync_log_id: str) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
@@ -586,9 +878,10 @@ class SyncLogger:
         """
         try:
             # Get sync log info
-            try:
+            include_website_fields = _schema_cap(SYNC_LOGS_WEBSITE_COLUMNS)
+            if include_website_fields:
                 log_query = """
-                    SELECT id, sync_type, status, total_documents, successful_documents,
+                    SELECT id::text, sync_type, status, total_documents, successful_documents,
                            failed_documents,
                            total_website_documents, successful_website_documents, failed_website_documents,
                            trigger_source, triggered_by, started_at,
@@ -596,26 +889,22 @@ class SyncLogger:
                     FROM sync_logs
                     WHERE id = %s
                 """
-                log_result, _ = safe_db_query(log_query, (sync_log_id,))
-                include_website_fields = True
-            except Exception as exc:
-                logging.warning("Falling back to legacy sync_logs detail schema: %s", exc)
+            else:
                 log_query = """
-                    SELECT id, sync_type, status, total_documents, successful_documents,
+                    SELECT id::text, sync_type, status, total_documents, successful_documents,
                            failed_documents, trigger_source, triggered_by, started_at,
                            finished_at, runtime_seconds, error_message, metadata
                     FROM sync_logs
                     WHERE id = %s
                 """
-                log_result, _ = safe_db_query(log_query, (sync_log_id,))
-                include_website_fields = False
+            log_result, _ = safe_db_query(log_query, (sync_log_id,))
             
             sync_log = None
             if log_result and isinstance(log_result, list) and len(log_result) > 0:
                 row = log_result[0]
                 if include_website_fields:
                     sync_log = {
-                        'id': str(row[0]),
+                        'id': row[0],
                         'sync_type': row[1],
                         'status': row[2],
                         'total_documents': row[3],
@@ -634,7 +923,7 @@ class SyncLogger:
                     }
                 else:
                     sync_log = {
-                        'id': str(row[0]),
+                        'id': row[0],
                         'sync_type': row[1],
                         'status': row[2],
                         'total_documents': row[3],
@@ -653,7 +942,8 @@ class SyncLogger:
                     }
             
             # Get document details
-            try:
+            include_item_fields = _schema_cap(SYNC_LOG_DETAILS_ITEM_COLUMNS)
+            if include_item_fields:
                 details_query = """
                     SELECT item_type, item_url, item_source,
                            document_title, document_filename, document_id, status,
@@ -662,10 +952,7 @@ class SyncLogger:
                     WHERE sync_log_id = %s
                     ORDER BY processed_at ASC
                 """
-                details_result, _ = safe_db_query(details_query, (sync_log_id,))
-                include_item_fields = True
-            except Exception as exc:
-                logging.warning("Falling back to legacy sync_log_details schema: %s", exc)
+            else:
                 details_query = """
                     SELECT document_title, document_filename, document_id, status,
                            error_message, file_size, metadata, processed_at
@@ -673,8 +960,7 @@ class SyncLogger:
                     WHERE sync_log_id = %s
                     ORDER BY processed_at ASC
                 """
-                details_result, _ = safe_db_query(details_query, (sync_log_id,))
-                include_item_fields = False
+            details_result, _ = safe_db_query(details_query, (sync_log_id,))
             
             document_details = []
             if details_result and isinstance(details_result, list):
@@ -1,17 +1,38 @@
 import re
 
+# Patterns for to_snake_case keyed by (allowStrip, allowDot)
+_RE_DEFAULT = re.compile(r'[_\W\s]+')
+_RE_STRIP_DOT = re.compile(r'[^A-Za-z0-9\-.]+')
+_RE_STRIP = re.compile(r'[^A-Za-z0-9\-]+')
+_RE_DOT = re.compile(r'[^A-Za-z0-9\.]+')
+_SNAKE_CASE_PATTERNS = {
+    (False, False): _RE_DEFAULT,
+    (True, True): _RE_STRIP_DOT,
+    (True, False): _RE_STRIP,
+    (False, True): _RE_DOT,
+}
+
+# ASCII fast path for the default pattern: every non-alphanumeric becomes '_'
+_DEFAULT_TABLE = str.maketrans({c: '_' for c in map(chr, range(128)) if not c.isalnum()})
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+
 def to_snake_case(s: str, allowStrip=False,allowDot=False) -> str:
-    if not allowDot and not allowStrip :
-        return re.sub(r'[_\W\s]+', '_', s.strip()).lower().strip('_') 
-    elif allowStrip and allowDot :
-        return re.sub(r'[^A-Za-z0-9\-.]+', '_', s.strip()).lower().strip('_') 
-    elif allowStrip  and not allowDot:
-        return re.sub(r'[^A-Za-z0-9\-]+', '_', s.strip()).lower().strip('_') 
-    elif not allowStrip and allowDot:
-        return re.sub(r'[^A-Za-z0-9\.]+', '_', s.strip()).lower().strip('_') 
+    s = s.strip()
+    if not allowStrip and not allowDot and s.isascii():
+        return _MULTI_UNDERSCORE.sub('_', s.translate(_DEFAULT_TABLE)).lower().strip('_')
+    pattern = _SNAKE_CASE_PATTERNS[(bool(allowStrip), bool(allowDot))]
+    return pattern.sub('_', s).lower().strip('_')
 
 def to_normal_text(s: str) -> str:
     return s.strip().replace("_", " ").capitalize()
 
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+# Common spellings accepted without normalizing the string first
+_TRUE_SET = _TRUE_VALUES | frozenset(("True", "TRUE", "Yes", "YES", "On", "ON"))
+
 def to_bool(value: str) -> bool:
-    return str(value).strip().lower() in ("true", "1", "yes", "on")
+    if value is True or value is False:
+        return value
+    if isinstance(value, str) and value in _TRUE_SET:
+        return True
+    return str(value).strip().lower() in _TRUE_VALUES
@@ -1,6 +1,9 @@
 """Centralized helpers for obtaining the current datetime."""
 from __future__ import annotations
 
+import logging
+import threading
+import time
 from datetime import datetime, timezone, tzinfo
 from typing import Optional
 
@@ -8,6 +11,12 @@ from .database import safe_db_query
 
 UTC_TZ: tzinfo = timezone.utc
 
+# Selisih jam database terhadap jam aplikasi (detik), di-refresh berkala
+_DB_OFFSET_TTL = 300.0
+_DB_OFFSET: Optional[float] = None
+_DB_OFFSET_FETCHED_AT = 0.0
+_DB_OFFSET_LOCK = threading.Lock()
+
 
 def _resolve_timezone(
     *,
@@ -22,12 +31,7 @@ def _resolve_timezone(
     return UTC_TZ
 
 
-def _db_now_utc() -> datetime:
-    """Ambil waktu saat ini dari database dalam UTC.
-
-    Menggunakan database sebagai sumber waktu agar tidak bergantung pada jam sistem aplikasi.
-    """
-
+def _query_db_now_utc() -> datetime:
     rows, _ = safe_db_query("SELECT CURRENT_TIMESTAMP AT TIME ZONE 'UTC'")
     if not rows:
         raise RuntimeError("Failed to obtain current time from database")
@@ -38,6 +42,46 @@ def _db_now_utc() -> datetime:
     return current.replace(tzinfo=UTC_TZ)
 
 
+def _db_clock_offset() -> float:
+    """Return the database clock offset, refreshing it every ``_DB_OFFSET_TTL`` seconds."""
+    global _DB_OFFSET, _DB_OFFSET_FETCHED_AT
+
+    offset = _DB_OFFSET
+    if offset is not None and time.monotonic() - _DB_OFFSET_FETCHED_AT < _DB_OFFSET_TTL:
+        return offset
+
+    with _DB_OFFSET_LOCK:
+        # Another thread may have refreshed it while we waited
+        if _DB_OFFSET is not None and time.monotonic() - _DB_OFFSET_FETCHED_AT < _DB_OFFSET_TTL:
+            return _DB_OFFSET
+
+        try:
+            before = time.time()
+            db_now = _query_db_now_utc()
+            after = time.time()
+        except Exception as exc:
+            if _DB_OFFSET is None:
+                raise
+            logging.warning(f"Failed to refresh database clock offset, keeping previous value: {exc}")
+            return _DB_OFFSET
+
+        # Bandingkan dengan titik tengah round-trip query
+        _DB_OFFSET = db_now.timestamp() - (before + after) / 2
+        _DB_OFFSET_FETCHED_AT = time.monotonic()
+        return _DB_OFFSET
+
+
+def _db_now_utc() -> datetime:
+    """Ambil waktu saat ini dari database dalam UTC.
+
+    Menggunakan database sebagai sumber waktu agar tidak bergantung pada jam sistem aplikasi.
+    Selisih jam database disimpan dan di-refresh tiap 5 menit, sehingga tidak ada
+    query per pemanggilan.
+    """
+
+    return datetime.fromtimestamp(time.time() + _db_clock_offset(), tz=UTC_TZ)
+
+
 def get_current_datetime(
     *,
     offset_hours: Optional[float] = None,
@@ -1,36 +1,67 @@
 import re
+import string
 
 
 #OPENAI_KEY_REGEX = re.compile(r"^sk-[A-Za-z0-9-]{20,}$")
 OPENAI_KEY_REGEX = re.compile(r"^sk-(?:proj-)?[-A-Za-z0-9_]{40,}$")
+# Same rule as OPENAI_KEY_REGEX without the regex engine: "proj-" only uses
+# allowed characters, so it is enough to check everything after "sk-"
+_OPENAI_KEY_PREFIX = "sk-"
+_OPENAI_KEY_MIN_TAIL = 40
+_OPENAI_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
 
 def valid_setting_datatype(data_type):
     return data_type in ['string', 'boolean', 'integer', 'array', 'object']
 
+_BOOL_STRINGS = frozenset(('1', 'true', '0', 'false'))
+
+
+def _valid_boolean(value):
+    if isinstance(value, bool):
+        return True
+    if str(value).lower() in _BOOL_STRINGS:
+        return True
+    if isinstance(value, int) and value in (0, 1):
+        return True
+    return False
+
+
+def _valid_integer(value):
+    try:
+        int(value)
+        if isinstance(value, bool):  # to exclude boolean values
+            return False
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _valid_array(value):
+    return isinstance(value, list) and len(value) > 0
+
+
+def _valid_object(value):
+    return isinstance(value, dict)
+
+
+def _valid_string(value):
+    return isinstance(value, str) and not isinstance(value, (list, dict, bool))
+
+
+_SETTING_VALIDATORS = {
+    'boolean': _valid_boolean,
+    'integer': _valid_integer,
+    'array': _valid_array,
+    'object': _valid_object,
+    'string': _valid_string,
+}
+
+
 def valid_setting_value(data_type, value):
-    if data_type == 'boolean':
-        if isinstance(value, bool):
-            return True
-        if str(value).lower() in ('1', 'true', '0', 'false'):
-            return True
-        if isinstance(value, int) and value in (0, 1):
-            return True
+    validator = _SETTING_VALIDATORS.get(data_type) if isinstance(data_type, str) else None
+    if validator is None:
         return False
-    elif data_type == 'integer':
-        try:
-            int(value)
-            if isinstance(value, bool):  # to exclude boolean values
-                return False
-            return True
-        except (ValueError, TypeError):
-            return False
-    elif data_type == 'array':
-        return isinstance(value, list) and len(value) > 0
-    elif data_type == 'object':
-        return isinstance(value, dict)
-    elif data_type == 'string':
-        return isinstance(value, str) and not isinstance(value, (list, dict, bool))
-    return False
+    return validator(value)
 
 
 def is_openai_api_key(value):
@@ -38,7 +69,11 @@ def is_openai_api_key(value):
         return False
 
     candidate = value.strip()
-    if len(candidate) < 24:
+    if not candidate.startswith(_OPENAI_KEY_PREFIX):
+        return False
+
+    tail = candidate[len(_OPENAI_KEY_PREFIX):]
+    if len(tail) < _OPENAI_KEY_MIN_TAIL:
         return False
 
-    return bool(OPENAI_KEY_REGEX.match(candidate))
+    return _OPENAI_KEY_CHARS.issuperset(tail)
@@ -3,14 +3,19 @@ import hashlib
 import json
 import logging
 import os
+import re
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin, urlsplit
 
 import requests
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.services.agent.search_service import SearchService
 from app.utils.database import safe_db_query
@@ -24,6 +29,25 @@ logger = logging.getLogger(__name__)
 _COMBIPHAR_DOMAINS = {"combiphar.com", "www.combiphar.com"}
 _DEFAULT_WEBSITES = ["https://www.combiphar.com/id"]
 _MAX_PAGES_PER_SITE = 200
+# Upper bound on concurrent page fetches while collecting a site
+_FETCH_WORKERS = 16
+# Number of pending chunks that triggers one batched add_documents call
+_EMBED_BATCH_CHUNKS = 256
+
+# Shared HTTP session so page fetches reuse keep-alive connections
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+# _slugify: ASCII non-alphanumerics become '_', then runs are collapsed
+_SLUG_TABLE = {i: '_' for i in range(128) if not chr(i).isalnum()}
+_MULTI_UNDERSCORE = re.compile(r'_+')
+# Stateless, so one instance is shared across ingestion runs
+_SPLITTER = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=200)
 
 
 def _slugify(value: str, fallback: str = "page") -> str:
@@ -34,8 +58,11 @@ def _slugify(value: str, fallback: str = "page") -> str:
     if not value:
         return fallback
 
-    slug = "".join(ch if ch.isalnum() else "_" for ch in value)
-    slug = "_".join(part for part in slug.split("_") if part)
+    slug = value.translate(_SLUG_TABLE)
+    if not slug.isascii():
+        # Non-ASCII punctuation/symbols still need the per-character check
+        slug = "".join(ch if ch.isalnum() else "_" for ch in slug)
+    slug = _MULTI_UNDERSCORE.sub('_', slug).strip('_')
     return slug or fallback
 
 
@@ -51,6 +78,47 @@ def _normalize_website_list(raw_setting: Any) -> List[str]:
     return websites or list(_DEFAULT_WEBSITES)
 
 
+def _fetch_pages_in_order(
+    fetch: Callable[[str], Optional[str]],
+    candidates: List[Tuple[str, Dict[str, Any]]],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Fetch candidate URLs concurrently, keeping the first ``limit`` with content.
+
+    At most ``_FETCH_WORKERS`` fetches are in flight; a new one is started as
+    soon as the oldest finishes, so one slow page does not stall a whole
+    batch. Results are consumed in candidate order, so the selected pages
+    match a sequential crawl, and fetches still queued once the limit is
+    reached are cancelled.
+    """
+    results: List[Dict[str, Any]] = []
+    if limit <= 0 or not candidates:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(candidates))) as executor:
+        remaining = iter(candidates)
+        in_flight = deque()
+        try:
+            for url, info in remaining:
+                in_flight.append((url, info, executor.submit(fetch, url)))
+                if len(in_flight) >= _FETCH_WORKERS:
+                    break
+
+            while in_flight and len(results) < limit:
+                url, info, future = in_flight.popleft()
+                next_candidate = next(remaining, None)
+                if next_candidate is not None:
+                    in_flight.append((*next_candidate, executor.submit(fetch, next_candidate[0])))
+                content = future.result()
+                if content:
+                    results.append({"url": url, **info, "content": content})
+        finally:
+            for _, _, future in in_flight:
+                future.cancel()
+
+    return results
+
+
 def _collect_combiphar_pages(search_service: SearchService, base_url: str, limit: int) -> List[Dict[str, Any]]:
     """Collect pages from the Combiphar corporate site via official API."""
     results: List[Dict[str, Any]] = []
@@ -62,7 +130,7 @@ def _collect_combiphar_pages(search_service: SearchService, base_url: str, limit
     base_prefix = f"{scheme}://{netloc.strip('/')}/"
 
     try:
-        response = requests.get(
+        response = _SESSION.get(
             "https://www.combiphar.com/back/api/v1/pages",
             timeout=10
         )
@@ -76,13 +144,10 @@ def _collect_combiphar_pages(search_service: SearchService, base_url: str, limit
     if not isinstance(pages, list):
         return results
 
+    candidates: List[Tuple[str, Dict[str, Any]]] = []
     for page in pages:
-        if len(results) >= limit:
-            break
         translations = page.get('translated_locales') or {}
         for locale, translation in translations.items():
-            if len(results) >= limit:
-                break
             if not isinstance(translation, dict):
                 continue
 
@@ -99,20 +164,14 @@ def _collect_combiphar_pages(search_service: SearchService, base_url: str, limit
             if url in seen_urls:
                 continue
 
-            content = search_service._fetch_combiphar_content(url)
-            if not content:
-                continue
-
             seen_urls.add(url)
-            results.append({
-                "url": url,
+            candidates.append((url, {
                 "title": title,
                 "locale": locale_code or None,
                 "source": netloc,
-                "content": content
-            })
+            }))
 
-    return results
+    return _fetch_pages_in_order(search_service._fetch_combiphar_content, candidates, limit)
 
 
 def _collect_generic_site_pages(search_service: SearchService, base_url: str, limit: int) -> List[Dict[str, Any]]:
@@ -136,29 +195,22 @@ def _collect_generic_site_pages(search_service: SearchService, base_url: str, li
     if not candidates:
         candidates = [base_root.rstrip('/')]
 
+    pending: List[Tuple[str, Dict[str, Any]]] = []
     for url in candidates:
-        if len(results) >= limit:
-            break
         if not isinstance(url, str):
             continue
         normalized = url.strip()
         if not normalized or normalized in seen_urls:
             continue
 
-        content = search_service._fetch_generic_site_content(normalized)
-        if not content:
-            continue
-
         seen_urls.add(normalized)
-        results.append({
-            "url": normalized,
+        pending.append((normalized, {
             "title": normalized,
             "locale": None,
             "source": netloc,
-            "content": content
-        })
+        }))
 
-    return results
+    return _fetch_pages_in_order(search_service._fetch_generic_site_content, pending, limit)
 
 
 def _delete_existing_document(vectorstore, document_id: uuid.UUID, stored_filename: str, storage_path: Optional[str]) -> None:
@@ -188,10 +240,43 @@ def _delete_existing_document(vectorstore, document_id: uuid.UUID, stored_filena
         logger.warning(f"⚠️ Failed to remove file for {stored_filename}: {exc}")
 
 
+def _insert_document_returning_id(
+    original_filename: str,
+    stored_filename: str,
+    size_bytes: int,
+    metadata: Dict[str, Any],
+    storage_path: str,
+) -> Optional[Any]:
+    """Insert a website document row and return its id from ``RETURNING``."""
+    insert_query = """
+        INSERT INTO documents
+        (source_type, original_filename, stored_filename, mime_type, size_bytes, metadata, storage_path, uploaded_by)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+    """
+    result, _ = safe_db_query(
+        insert_query,
+        (
+            'website',
+            original_filename,
+            stored_filename,
+            'text/plain',
+            size_bytes,
+            json.dumps(metadata),
+            storage_path,
+            None
+        )
+    )
+
+    if not isinstance(result, list) or not result:
+        logger.error(f"❌ INSERT ... RETURNING id yielded no row for {stored_filename}: {result!r}")
+        return None
+    return result[0][0]
+
+
 def _split_chunks(text: str, splitter: RecursiveCharacterTextSplitter) -> List[str]:
     """Split text into cleaned chunks for embedding."""
-    chunks = splitter.split_text(text or "")
-    return [chunk.strip() for chunk in chunks if chunk and chunk.strip()]
+    return [stripped for chunk in splitter.split_text(text or "") if (stripped := chunk.strip())]
 
 
 def pull_combiphar_websites(
@@ -213,17 +298,134 @@ def pull_combiphar_websites(
         logger.error("❌ Vector store unavailable, aborting website ingestion.")
         return {"message": "Vector store unavailable", "summary": summary, "ingested_urls": ingested_urls}
 
-    search_service = SearchService(llm=None, prompt_service=None)
+    search_service = SearchService(llm=None, prompt_service=None, http_session=_SESSION)
 
     websites_setting = get_setting_value_by_name("combiphar_websites")
     websites = _normalize_website_list(websites_setting)
 
-    splitter = RecursiveCharacterTextSplitter(chunk_size=1500, chunk_overlap=200)
+    splitter = _SPLITTER
     storage_folder = data_path('documents', 'website')
     os.makedirs(storage_folder, exist_ok=True)
 
+    # Pages whose chunks are waiting to be embedded in one add_documents call
+    pending_pages: List[Dict[str, Any]] = []
+    pending_chunks = 0
+    existing_by_url: Dict[str, tuple] = {}
+    vector_doc_ids = set()
+
+    # content_hash -> (document_id, url) of an embedded website document, so
+    # pages duplicating another URL's content (e.g. locale variants) are not
+    # stored and embedded again
+    content_hash_owner: Dict[str, Tuple[str, str]] = {}
+    try:
+        hash_rows, _ = safe_db_query(
+            """
+                SELECT d.metadata->>'content_hash', d.id::text, d.metadata->>'url'
+                FROM documents d
+                WHERE d.source_type = 'website'
+                  AND EXISTS (SELECT 1 FROM documents_vectors v WHERE v.document_id = d.id)
+            """
+        )
+        if isinstance(hash_rows, list):
+            for content_hash, document_id, url in hash_rows:
+                if content_hash and url:
+                    content_hash_owner.setdefault(content_hash, (document_id, url))
+    except Exception as hash_err:
+        logger.warning(f"Failed to load website content hashes: {hash_err}")
+
+    def _record_page_result(entry: Dict[str, Any], error: Optional[Exception]) -> None:
+        url = entry["url"]
+        document_db_id = entry["document_db_id"]
+        if error is not None:
+            logger.error(f"❌ Failed to add website chunks to vector store for {url}: {error}")
+            content_hash = entry["metadata"].get("content_hash")
+            if content_hash_owner.get(content_hash, (None,))[0] == str(document_db_id):
+                content_hash_owner.pop(content_hash, None)
+            summary["errors"].append(f"Vectorstore error for {url}: {error}")
+            if sync_logger:
+                sync_logger.log_document_result(
+                    document_title=entry["title"],
+                    document_filename=entry["original_filename"],
+                    document_id=str(document_db_id) if document_db_id else None,
+                    status='failed',
+                    error_message=f"Vectorstore error for {url}: {error}",
+                    file_size=entry["size_bytes"],
+                    metadata={
+                        'source_type': 'website',
+                        'url': url,
+                        'source': entry["host"],
+                        'stage': 'vectorstore_add'
+                    },
+                    item_type='website',
+                    item_url=url,
+                    item_source=entry["host"],
+                )
+            return
+
+        existing_by_url[url] = (document_db_id, entry["stored_filename"], entry["metadata"], entry["storage_path"])
+        vector_doc_ids.add(str(document_db_id))
+
+        summary["processed"] += 1
+        if entry["was_update"]:
+            summary["updated"] += 1
+        else:
+            summary["created"] += 1
+        ingested_urls.append(url)
+
+        if sync_logger:
+            sync_logger.log_document_result(
+                document_title=entry["title"],
+                document_filename=entry["original_filename"],
+                document_id=str(document_db_id) if document_db_id else None,
+                status='success',
+                error_message=None,
+                file_size=entry["size_bytes"],
+                metadata={
+                    'source_type': 'website',
+                    'url': url,
+                    'source': entry["host"],
+                    'was_update': entry["was_update"],
+                    'chunks_count': len(entry["docs"]),
+                },
+                item_type='website',
+                item_url=url,
+                item_source=entry["host"],
+            )
+
+    def _flush_pending() -> None:
+        """Embed and store all pending chunks, then report each page."""
+        nonlocal pending_chunks
+        if not pending_pages:
+            return
+        batch = list(pending_pages)
+        pending_pages.clear()
+        pending_chunks = 0
+
+        try:
+            vectorstore.add_documents([doc for entry in batch for doc in entry["docs"]])
+        except Exception as batch_exc:
+            if len(batch) == 1:
+                _record_page_result(batch[0], batch_exc)
+                return
+            # Retry page by page so a failure is attributed to the right page
+            logger.warning(f"Batched website embedding failed, retrying per page: {batch_exc}")
+            for entry in batch:
+                try:
+                    vectorstore.add_documents(entry["docs"])
+                except Exception as exc:
+                    _record_page_result(entry, exc)
+                else:
+                    _record_page_result(entry, None)
+            return
+
+        for entry in batch:
+            _record_page_result(entry, None)
+
     logger.info(f"🌐 Starting website ingestion for {len(websites)} site(s)")
 
+    # One timestamp per run for last_fetched_at / chunk created_at
+    now = get_current_datetime().isoformat()
+
     for site in websites:
         if not isinstance(site, str):
             continue
@@ -246,6 +448,56 @@ def pull_combiphar_websites(
 
         logger.info(f"📄 Discovered {len(pages)} candidate pages for {site}")
 
+        # Prefetch existing website rows and embedded document ids for this
+        # site so the page loop does lookups instead of per-page queries.
+        # NOTE: metadata is JSONB, so filter on metadata->>'url' directly; a
+        # ::json cast re-parses every row and misses idx_documents_website_url
+        # (see schema/migrations/20251203_add_documents_website_url_index.sql).
+        page_urls = [page.get("url") for page in pages if page.get("url")]
+        existing_by_url = {}
+        vector_doc_ids = set()
+        if page_urls:
+            try:
+                existing_rows, _ = safe_db_query(
+                    """
+                        SELECT id, stored_filename, metadata, storage_path, metadata->>'url'
+                        FROM documents
+                        WHERE source_type = 'website' AND metadata->>'url' = ANY(%s)
+                    """,
+                    (page_urls,),
+                )
+            except Exception as prefetch_err:
+                logger.error(f"❌ Failed to load existing website documents for {site}: {prefetch_err}")
+                summary["errors"].append(f"{site}: {prefetch_err}")
+                continue
+            if isinstance(existing_rows, list):
+                for row in existing_rows:
+                    existing_by_url.setdefault(row[4], tuple(row[:4]))
+
+        existing_ids = [str(row[0]) for row in existing_by_url.values() if row[0]]
+        if existing_ids:
+            try:
+                vector_rows, _ = safe_db_query(
+                    """
+                        SELECT DISTINCT document_id
+                        FROM documents_vectors
+                        WHERE document_id = ANY(%s::uuid[])
+                    """,
+                    (existing_ids,),
+                )
+                if isinstance(vector_rows, list):
+                    vector_doc_ids = {str(row[0]) for row in vector_rows}
+            except Exception as vector_err:
+                logger.warning(f"Failed to verify embeddings for website documents of {site}: {vector_err}")
+
+        # One directory listing per site instead of a stat per existing page
+        existing_files = set()
+        if existing_by_url:
+            try:
+                existing_files = set(os.listdir(storage_folder))
+            except OSError as list_err:
+                logger.warning(f"Failed to list {storage_folder}: {list_err}")
+
         for page in pages:
             try:
                 url = page.get("url")
@@ -254,8 +506,9 @@ def pull_combiphar_websites(
                     summary["skipped"] += 1
                     continue
 
-                content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-                now = get_current_datetime().isoformat()
+                # Encoded once: reused for the hash, the stored file and its size
+                encoded = content.encode('utf-8')
+                content_hash = hashlib.sha256(encoded).hexdigest()
 
                 metadata_payload = {
                     "url": url,
@@ -266,53 +519,57 @@ def pull_combiphar_websites(
                     "last_fetched_at": now
                 }
 
-                existing_query = """
-                    SELECT id, stored_filename, metadata, storage_path
-                    FROM documents
-                    WHERE source_type = 'website' AND metadata::json->>'url' = %s
-                """
-                existing_results, _ = safe_db_query(existing_query, (url,))
+                # Checked before any existing row is deleted, so a page that
+                # now duplicates another URL keeps its previous document
+                owner = content_hash_owner.get(content_hash)
+                if owner and owner[1] != url:
+                    logger.info(f"⏭️ Skipping {url}: same content as already embedded {owner[1]}")
+                    summary["skipped"] += 1
+                    if sync_logger:
+                        sync_logger.log_document_result(
+                            document_title=page.get("title") or url,
+                            document_filename=None,
+                            document_id=None,
+                            status='skipped',
+                            error_message=f"Same content as {owner[1]}",
+                            file_size=len(encoded),
+                            metadata={
+                                'source_type': 'website',
+                                'url': url,
+                                'source': host,
+                                'duplicate_of': owner[1]
+                            },
+                            item_type='website',
+                            item_url=url,
+                            item_source=host,
+                        )
+                    continue
 
                 document_db_id = None
                 stored_filename = None
                 storage_path = None
                 was_update = False
 
-                if isinstance(existing_results, list) and existing_results:
-                    existing_row = existing_results[0]
+                existing_row = existing_by_url.get(url)
+                if existing_row:
                     document_db_id = existing_row[0]
                     stored_filename = existing_row[1]
-                    existing_metadata = existing_row[2] if len(existing_row) > 2 else {}
-                    storage_path = existing_row[3] if len(existing_row) > 3 else None
+                    existing_metadata = existing_row[2]
+                    storage_path = existing_row[3]
 
                     previous_hash = ""
                     if isinstance(existing_metadata, dict):
                         previous_hash = existing_metadata.get("content_hash", "")
 
-                    file_candidates = []
-                    if storage_path:
+                    file_exists = bool(stored_filename) and stored_filename in existing_files
+                    if not file_exists and storage_path:
+                        # Rows whose file lives outside the storage folder
                         if os.path.isabs(storage_path):
-                            file_candidates.append(storage_path)
+                            file_exists = os.path.isfile(storage_path)
                         else:
-                            file_candidates.append(os.path.join('.', storage_path))
-                    if stored_filename:
-                        file_candidates.append(os.path.join(storage_folder, stored_filename))
-
-                    file_exists = any(os.path.isfile(path) for path in file_candidates)
-
-                    vectors_exist = False
-                    if document_db_id:
-                        try:
-                            vector_count_rows, _ = safe_db_query(
-                                "SELECT COUNT(*) FROM documents_vectors WHERE document_id = %s",
-                                (document_db_id,),
-                            )
-                            if isinstance(vector_count_rows, list) and vector_count_rows:
-                                vectors_exist = (vector_count_rows[0][0] or 0) > 0
-                        except Exception as vector_err:
-                            logger.warning(
-                                f"Failed to verify embeddings for website document {document_db_id}: {vector_err}"
-                            )
+                            file_exists = os.path.isfile(os.path.join('.', storage_path))
+
+                    vectors_exist = bool(document_db_id) and str(document_db_id) in vector_doc_ids
 
                     artifacts_intact = file_exists and vectors_exist
 
@@ -322,6 +579,9 @@ def pull_combiphar_websites(
 
                     was_update = True
                     _delete_existing_document(vectorstore, document_db_id, stored_filename, storage_path)
+                    if content_hash_owner.get(previous_hash, (None,))[0] == str(document_db_id):
+                        content_hash_owner.pop(previous_hash, None)
+                    existing_by_url.pop(url, None)
                     document_db_id = None
                     stored_filename = None
                     storage_path = None
@@ -332,45 +592,22 @@ def pull_combiphar_websites(
                     slug_base = f"{slug_base}_{_slugify(locale_suffix)}"
                 original_filename = f"{slug_base[:120]}.txt"
 
-                temp_path = os.path.join(storage_folder, original_filename)
-                with open(temp_path, 'w', encoding='utf-8') as handle:
-                    handle.write(content)
-                size_bytes = os.path.getsize(temp_path)
-
+                # original_filename is metadata only; the file lives under its UUID name
                 stored_filename = f"{uuid.uuid4()}.txt"
                 new_path = os.path.join(storage_folder, stored_filename)
-                if temp_path != new_path:
-                    os.replace(temp_path, new_path)
+                with open(new_path, 'wb') as handle:
+                    handle.write(encoded)
+                size_bytes = len(encoded)
                 storage_path = os.path.relpath(new_path, '.')
 
-                insert_query = """
-                    INSERT INTO documents
-                    (source_type, original_filename, stored_filename, mime_type, size_bytes, metadata, storage_path, uploaded_by)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                """
-                result, _ = safe_db_query(
-                    insert_query,
-                    (
-                        'website',
-                        original_filename,
-                        stored_filename,
-                        'text/plain',
-                        size_bytes,
-                        json.dumps(metadata_payload),
-                        storage_path,
-                        None
-                    )
+                document_db_id = _insert_document_returning_id(
+                    original_filename,
+                    stored_filename,
+                    size_bytes,
+                    metadata_payload,
+                    storage_path,
                 )
 
-                if isinstance(result, list) and result:
-                    document_db_id = result[0][0]
-                elif isinstance(result, int) and result > 0 and stored_filename:
-                    confirm_query = "SELECT id FROM documents WHERE stored_filename = %s ORDER BY created_at DESC LIMIT 1"
-                    confirm_result, _ = safe_db_query(confirm_query, (stored_filename,))
-                    if isinstance(confirm_result, list) and confirm_result:
-                        document_db_id = confirm_result[0][0]
-
                 if not document_db_id:
                     logger.error(f"❌ Failed to persist document record for {url}")
                     summary["errors"].append(f"Failed to insert document for {url}")
@@ -403,78 +640,44 @@ def pull_combiphar_websites(
                 chunk_total = len(chunks)
                 display_name = original_filename or page.get("title") or url
                 prefix = f"{display_name}\n\n" if display_name else ""
+                base_metadata = {
+                    "document_id": str(document_db_id),
+                    "chat_id": None,
+                    "source_type": "website",
+                    "uploaded_by": None,
+                    "original_filename": original_filename,
+                    "stored_filename": stored_filename,
+                    "storage_path": storage_path,
+                    "mime_type": 'text/plain',
+                    "chunk_total": chunk_total,
+                    "created_at": now,
+                    "url": url,
+                    "title": page.get("title"),
+                    "locale": page.get("locale"),
+                    "source": page.get("source")
+                }
                 for index, chunk in enumerate(chunks):
-                    metadata = {
-                        "document_id": str(document_db_id),
-                        "chat_id": None,
-                        "source_type": "website",
-                        "uploaded_by": None,
-                        "original_filename": original_filename,
-                        "stored_filename": stored_filename,
-                        "storage_path": storage_path,
-                        "mime_type": 'text/plain',
-                        "chunk_index": index,
-                        "chunk_total": chunk_total,
-                        "created_at": now,
-                        "url": url,
-                        "title": page.get("title"),
-                        "locale": page.get("locale"),
-                        "source": page.get("source")
-                    }
+                    metadata = {**base_metadata, "chunk_index": index}
                     content = f"{prefix}{chunk}" if prefix else chunk
                     docs.append(Document(page_content=content, metadata=metadata))
 
-                try:
-                    vectorstore.add_documents(docs)
-                except Exception as exc:
-                    logger.error(f"❌ Failed to add website chunks to vector store for {url}: {exc}")
-                    summary["errors"].append(f"Vectorstore error for {url}: {exc}")
-                    if sync_logger:
-                        sync_logger.log_document_result(
-                            document_title=page.get("title") or url,
-                            document_filename=original_filename,
-                            document_id=str(document_db_id) if document_db_id else None,
-                            status='failed',
-                            error_message=f"Vectorstore error for {url}: {exc}",
-                            file_size=size_bytes,
-                            metadata={
-                                'source_type': 'website',
-                                'url': url,
-                                'source': host,
-                                'stage': 'vectorstore_add'
-                            },
-                            item_type='website',
-                            item_url=url,
-                            item_source=host,
-                        )
-                    continue
-
-                summary["processed"] += 1
-                if was_update:
-                    summary["updated"] += 1
-                else:
-                    summary["created"] += 1
-                ingested_urls.append(url)
-
-                if sync_logger:
-                    sync_logger.log_document_result(
-                        document_title=page.get("title") or url,
-                        document_filename=original_filename,
-                        document_id=str(document_db_id) if document_db_id else None,
-                        status='success',
-                        error_message=None,
-                        file_size=size_bytes,
-                        metadata={
-                            'source_type': 'website',
-                            'url': url,
-                            'source': host,
-                            'was_update': was_update,
-                            'chunks_count': len(docs),
-                        },
-                        item_type='website',
-                        item_url=url,
-                        item_source=host,
-                    )
+                pending_pages.append({
+                    "url": url,
+                    "title": page.get("title") or url,
+                    "host": host,
+                    "original_filename": original_filename,
+                    "document_db_id": document_db_id,
+                    "stored_filename": stored_filename,
+                    "storage_path": storage_path,
+                    "metadata": metadata_payload,
+                    "size_bytes": size_bytes,
+                    "was_update": was_update,
+                    "docs": docs,
+                })
+                pending_chunks += len(docs)
+                content_hash_owner.setdefault(content_hash, (str(document_db_id), url))
+                if pending_chunks >= _EMBED_BATCH_CHUNKS:
+                    _flush_pending()
 
             except Exception as exc:  # pragma: no cover - ingestion resilience
                 logger.error(f"❌ Error processing page {page.get('url')}: {exc}")
@@ -500,6 +703,11 @@ def pull_combiphar_websites(
                         item_source=host,
                     )
 
+        # Site finished: embed whatever is still pending for it
+        _flush_pending()
+
+    _flush_pending()
+
     summary["skipped"] = max(summary["skipped"], 0)
 
     return {
@@ -199,10 +199,13 @@ CREATE INDEX IF NOT EXISTS idx_token_refresh_user_id ON token_refresh(user_id);
 CREATE INDEX IF NOT EXISTS idx_token_refresh_expires_at ON token_refresh(expires_at);
 CREATE INDEX IF NOT EXISTS idx_token_revoked_expires_at ON token_revoked(expires_at);
 CREATE INDEX IF NOT EXISTS document_sync_state_idx ON document_sync(state);
+CREATE INDEX IF NOT EXISTS idx_documents_portal_fn ON documents((metadata->>'FileName')) WHERE source_type = 'portal';
+CREATE INDEX IF NOT EXISTS idx_documents_website_url ON documents((metadata->>'url')) WHERE source_type = 'website';
 
 CREATE INDEX IF NOT EXISTS idx_sync_logs_sync_type ON sync_logs(sync_type);
 CREATE INDEX IF NOT EXISTS idx_sync_logs_status ON sync_logs(status);
 CREATE INDEX IF NOT EXISTS idx_sync_logs_started_at ON sync_logs(started_at);
+CREATE INDEX IF NOT EXISTS idx_sync_logs_started_at_id ON sync_logs(started_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_sync_logs_triggered_by ON sync_logs(triggered_by);
 
 CREATE INDEX IF NOT EXISTS idx_sync_log_details_sync_log_id ON sync_log_details(sync_log_id);
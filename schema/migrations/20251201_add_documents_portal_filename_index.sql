@@ -0,0 +1,11 @@
+-- Migration: Index portal documents by portal FileName
+-- Date: 2025-12-01
+-- Description: Speed up the batched existence lookup used by the portal pull.
+
+START TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_documents_portal_fn
+    ON documents ((metadata->>'FileName'))
+    WHERE source_type = 'portal';
+
+COMMIT;
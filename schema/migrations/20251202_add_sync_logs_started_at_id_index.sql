@@ -0,0 +1,10 @@
+-- Migration: Index sync_logs by (started_at, id) for keyset pagination
+-- Date: 2025-12-02
+-- Description: Matches the ORDER BY started_at DESC, id DESC used by the sync log listing.
+
+START TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_sync_logs_started_at_id
+    ON sync_logs (started_at DESC, id DESC);
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Migration: Index website documents by source URL
+-- Date: 2025-12-03
+-- Description: Speed up the per-site existence lookup used by the website pull.
+
+START TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS idx_documents_website_url
+    ON documents ((metadata->>'url'))
+    WHERE source_type = 'website';
+
+COMMIT;